@@ -1,7 +1,10 @@
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, TypeAdapter
 from typing import List, Dict, Any, Literal, Optional
+from typing_extensions import Annotated, NotRequired, TypedDict # typing_extensions.TypedDict is required by Pydantic on Python < 3.12
 
 
+# Kept as Literal types: pydantic-core validates string Literals with a single hash lookup, which
+# measured faster than a plain `str` field plus a Python frozenset validator.
 ALLOWED_SENTIMENTS = Literal["Positive", "Negative", "Neutral"]
 ALLOWED_SOURCE_TYPES = Literal[
     "Guideline", "Label", "Phase 4 CT", "Phase 3 CT", "Phase 2 CT",
@@ -11,21 +14,27 @@ ALLOWED_DOMINANT_SENTIMENTS = Literal["Positive", "Negative", "Neutral", "Mixed"
 
 # --- Input Models ---
 
-class MentionItem(BaseModel):
-    """ Defines the structure for a single relationship mention. """
-    source_type: ALLOWED_SOURCE_TYPES = Field(..., description="Type of the source document")
-    year: int = Field(..., gt=1900, lt=2100, description="Year the mention was recorded/published (within reasonable range)")
-    sentiment: ALLOWED_SENTIMENTS = Field(..., description="Pre-calculated sentiment")
-    mention_id: Optional[str] = Field(None, description="Optional source-specific identifier for traceability", examples=["pmid:12345678", "NCT00001234"])
+class MentionItem(TypedDict):
+    """
+    Defines the structure for a single relationship mention.
 
-    model_config = ConfigDict(extra='forbid') 
+    A TypedDict rather than a BaseModel: mentions are validated as part of ScorerInputData
+    but stay plain dicts, avoiding a model instantiation per mention. Access fields by key
+    (e.g., mention['year']).
+    """
+    __pydantic_config__ = ConfigDict(extra='forbid')
+
+    source_type: Annotated[ALLOWED_SOURCE_TYPES, Field(description="Type of the source document")]
+    year: Annotated[int, Field(gt=1900, lt=2100, description="Year the mention was recorded/published (within reasonable range)")]
+    sentiment: Annotated[ALLOWED_SENTIMENTS, Field(description="Pre-calculated sentiment")]
+    mention_id: NotRequired[Annotated[Optional[str], Field(description="Optional source-specific identifier for traceability", examples=["pmid:12345678", "NCT00001234"])]]
 
 class EntityMetadata(BaseModel):
     """ Defines the structure for metadata associated with each entity. """
     id: str = Field(..., min_length=1, description="Unique identifier for the entity")
     overall_prominence: float = Field(..., ge=0.0, description="Pre-calculated prominence score (e.g., weighted frequency) for normalization")
 
-    model_config = ConfigDict(extra='forbid') 
+    model_config = ConfigDict(extra='forbid', frozen=True)
 
 class ScorerInputData(BaseModel):
     """ Pydantic model for validating the entire input dictionary to RelationshipScorer. """
@@ -33,7 +42,15 @@ class ScorerInputData(BaseModel):
     entity_a_metadata: EntityMetadata = Field(..., description="Metadata for Entity A")
     entity_b_metadata: EntityMetadata = Field(..., description="Metadata for Entity B")
 
-    model_config = ConfigDict(extra='forbid') 
+    model_config = ConfigDict(extra='forbid', frozen=True)
+
+# Validators for RelationshipScorer input, built once per process
+INPUT_ADAPTER = TypeAdapter(ScorerInputData)
+BATCH_INPUT_ADAPTER = TypeAdapter(List[ScorerInputData])
+
+# --- Output Models ---
+# Built in-process from known keys, so unlike the input models they do not forbid extra fields.
+# Like the input models they are frozen, since nothing modifies them once built.
 
 class SentimentScoresOutput(BaseModel):
     """ Defines the structure for the detailed sentiment score output. """
@@ -43,7 +60,7 @@ class SentimentScoresOutput(BaseModel):
     net_score: float = Field(..., description="Calculated net score (e.g., positive - negative)")
     dominant_sentiment: ALLOWED_DOMINANT_SENTIMENTS = Field(..., description="Overall dominant sentiment category")
 
-    model_config = ConfigDict(extra='forbid')
+    model_config = ConfigDict(frozen=True)
 
 class TrendScoresOutput(BaseModel):
     """Defines the structure for the detailed trend score output."""
@@ -51,7 +68,7 @@ class TrendScoresOutput(BaseModel):
     rate_of_change: float = Field(..., description="Score based on rate of change between time windows")
     evidence_progression: float = Field(..., description="Score based on progression in evidence hierarchy")
 
-    model_config = ConfigDict(extra='forbid')
+    model_config = ConfigDict(frozen=True)
 
 class ScorerOutputData(BaseModel):
     """Pydantic model for validating the final output dictionary from get_all_scores."""
@@ -59,5 +76,4 @@ class ScorerOutputData(BaseModel):
     sentiment_scores: SentimentScoresOutput = Field(..., description="Detailed sentiment breakdown")
     trend_scores: TrendScoresOutput = Field(..., description="Detailed trend scores from different perspectives")
 
-    model_config = ConfigDict(extra='forbid') 
-
+    model_config = ConfigDict(frozen=True)
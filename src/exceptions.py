@@ -1,6 +1,8 @@
 # src/exceptions.py
 # Custom exception classes for the relationship scorer package.
 
+from functools import cached_property
+
 class RelationshipScorerError(Exception):
     """Base class for exceptions in this package."""
     pass
@@ -27,13 +29,23 @@ class InputValidationError(ScoringInitializationError):
     """Specific exception for Pydantic input validation errors."""
     def __init__(self, pydantic_error):
         self.message = f"Input data validation failed: {pydantic_error}"
-        self.details = pydantic_error.errors() # Store detailed Pydantic errors
+        self.pydantic_error = pydantic_error
         super().__init__(self.message)
 
+    @cached_property
+    def details(self):
+        """ Detailed Pydantic errors, built on first access (ValidationError.errors() is not free). """
+        return self.pydantic_error.errors()
+
 class OutputValidationError(CalculationError):
     """Specific exception for Pydantic output validation errors."""
     def __init__(self, pydantic_error):
         self.message = f"Output data validation failed: {pydantic_error}"
-        self.details = pydantic_error.errors() # Store detailed Pydantic errors
+        self.pydantic_error = pydantic_error
         super().__init__(self.message)
 
+    @cached_property
+    def details(self):
+        """ Detailed Pydantic errors, built on first access (ValidationError.errors() is not free). """
+        return self.pydantic_error.errors()
+
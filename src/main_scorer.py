@@ -1,11 +1,15 @@
 # Contains the main RelationshipScorer class for calculating ensemble scores.
 
+import datetime
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from functools import cached_property
 from pydantic import ValidationError
 
 
 from .utils.config_loader import load_config
 from .utils.logger import get_logger
-from .scoring import evidence, sentiment, trend
+from .scoring._features import MentionFeatures
 from .exceptions import (
     ScoringInitializationError,
     CalculationError,
@@ -17,9 +21,23 @@ from .data_models.models import (
     ScorerInputData,
     ScorerOutputData,
     MentionItem,
-    EntityMetadata
+    EntityMetadata,
+    INPUT_ADAPTER,
+    BATCH_INPUT_ADAPTER
 )
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Sequence, Tuple, Union
+
+try:
+    import orjson # Optional: faster JSON serialization for get_all_scores_json
+except ImportError:
+    orjson = None
+    import json
+
+def _dumps_json(obj: Any) -> bytes:
+    """ Serializes `obj` to compact UTF-8 JSON bytes, using orjson when it is installed. """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
 
 class RelationshipScorer:
     """
@@ -30,11 +48,35 @@ class RelationshipScorer:
     or the complete ensemble.
     """
     # Class attributes for validated data and config
-    mentions: List[MentionItem]
+    features: MentionFeatures # Struct-of-arrays view of `mentions`, built during preprocessing
     entity_a: EntityMetadata
     entity_b: EntityMetadata
     config: Dict[str, Any]
-    logger: Any
+    _validate_output: bool
+    _fused: bool
+    # (years, source_types, sentiments) for scorers built by `from_columns`, which have no mention dicts up front
+    _mention_columns: Optional[Tuple[Sequence[int], Sequence[str], Sequence[str]]] = None
+    # Configuration shared by all scorer instances; assign a dict here to bypass load_config (e.g., in tests)
+    _config_cache: Optional[Dict[str, Any]] = None
+
+    @cached_property
+    def logger(self) -> logging.Logger:
+        """ The package logger, acquired on first use rather than in every constructor. """
+        return get_logger()
+
+    @cached_property
+    def mentions(self) -> List[MentionItem]:
+        """
+        The relationship's MentionItem dicts.
+
+        Set directly by the other constructors; for a `from_columns` scorer they are only
+        built from the columns on first access (scoring itself works on `features`).
+        """
+        years, source_types, sentiments = self._mention_columns
+        return [
+            {"source_type": source_type, "year": year, "sentiment": sentiment}
+            for year, source_type, sentiment in zip(years, source_types, sentiments)
+        ]
 
     def __init__(self, input_data: Dict[str, Any]):
         """
@@ -48,31 +90,375 @@ class RelationshipScorer:
         Raises:
             ScoringInitializationError: If input data fails validation or config cannot be loaded.
         """
-        self.logger = get_logger() 
-        self.logger.info(f"Initializing RelationshipScorer for entity pair: {input_data.get('entity_a_metadata',{}).get('id','N/A')} - {input_data.get('entity_b_metadata',{}).get('id','N/A')}")
-
         # 1. Validate input using Pydantic
         try:
-            validated_input = ScorerInputData(**input_data)
+            validated_input = INPUT_ADAPTER.validate_python(input_data)
             # Store validated components directly
             self.mentions = validated_input.relationship_mentions
             self.entity_a = validated_input.entity_a_metadata
             self.entity_b = validated_input.entity_b_metadata
             self.logger.debug("Input data validated successfully via Pydantic.")
         except ValidationError as e:
-            self.logger.error(f"Input data validation failed: {e}", exc_info=True)
+            self.logger.error(f"Input data validation failed: {e}", exc_info=self.logger.isEnabledFor(logging.DEBUG))
             # Wrap Pydantic error in our custom exception for consistency
             raise InputValidationError(e)
         except Exception as e:
              self.logger.error(f"Unexpected error during input data processing: {e}", exc_info=True)
              raise ScoringInitializationError(f"Unexpected error processing input data: {e}")
 
+        # Logged after validation so the entity IDs are read from the validated models
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("Initializing RelationshipScorer for entity pair: %s - %s", self.entity_a.id, self.entity_b.id)
+
+        # 2. Load configuration and preprocess
+        self._load_config_and_preprocess()
+
+        self.logger.info("RelationshipScorer initialized successfully.")
+
+    @classmethod
+    def from_trusted(cls, input_data: Dict[str, Any]) -> "RelationshipScorer":
+        """
+        Builds a scorer from input data that is already known to be valid, skipping Pydantic validation.
+
+        Intended for internal/trusted callers (e.g., batch pipelines reading from a validated store).
+        Entity models are built with `model_construct` and mentions are used as-is, so no field
+        checks are run; malformed data will only surface as errors during score calculation.
+        External input should go through the regular constructor.
+
+        Args:
+            input_data (dict): Dictionary with the same structure as expected by `__init__`.
+
+        Returns:
+            RelationshipScorer: An initialized scorer instance.
+
+        Raises:
+            ScoringInitializationError: If required keys are missing or config cannot be loaded.
+        """
+        scorer = cls.__new__(cls)
+
+        try:
+            scorer.mentions, scorer.entity_a, scorer.entity_b = cls._construct_trusted(input_data)
+        except ScoringInitializationError as e:
+            scorer.logger.error(str(e), exc_info=True)
+            raise
+        if scorer.logger.isEnabledFor(logging.INFO):
+            scorer.logger.info("Initializing RelationshipScorer (trusted input) for entity pair: %s - %s", scorer.entity_a.id, scorer.entity_b.id)
+
+        scorer._load_config_and_preprocess()
+
+        scorer.logger.info("RelationshipScorer initialized successfully.")
+        return scorer
+
+    @classmethod
+    def from_models(cls, mentions: List[MentionItem], entity_a: EntityMetadata, entity_b: EntityMetadata,
+                    config: Optional[Dict[str, Any]] = None) -> "RelationshipScorer":
+        """
+        Builds a scorer from already built input models, skipping Pydantic validation.
+
+        For callers that hold the validated (or `model_construct`-ed) components of a
+        ScorerInputData, e.g. from an earlier `INPUT_ADAPTER.validate_python` call: they are
+        used as-is, like `from_trusted` does with raw input.
+
+        Args:
+            mentions (list): The relationship's MentionItem dicts.
+            entity_a (EntityMetadata): Metadata for entity A.
+            entity_b (EntityMetadata): Metadata for entity B.
+            config (dict, optional): Configuration to score with. Defaults to None (the shared loaded configuration).
+
+        Returns:
+            RelationshipScorer: An initialized scorer instance.
+
+        Raises:
+            ScoringInitializationError: If config cannot be loaded.
+        """
+        scorer = cls.__new__(cls)
+        scorer.mentions, scorer.entity_a, scorer.entity_b = mentions, entity_a, entity_b
+        if scorer.logger.isEnabledFor(logging.INFO):
+            scorer.logger.info("Initializing RelationshipScorer (prebuilt models) for entity pair: %s - %s", scorer.entity_a.id, scorer.entity_b.id)
+
+        scorer._load_config_and_preprocess(config)
+
+        scorer.logger.info("RelationshipScorer initialized successfully.")
+        return scorer
+
+    @classmethod
+    def from_columns(cls, years: Sequence[int], source_types: Sequence[str], sentiments: Sequence[str],
+                     entity_a: EntityMetadata, entity_b: EntityMetadata,
+                     config: Optional[Dict[str, Any]] = None) -> "RelationshipScorer":
+        """
+        Builds a scorer from column-oriented mentions (one sequence per MentionItem field), skipping Pydantic validation.
+
+        For callers that already hold the mentions as parallel columns (e.g., read from a
+        columnar store): the i-th mention is (years[i], source_types[i], sentiments[i]).
+        Like `from_models`, the values are trusted as-is. The MentionFeatures used for scoring
+        are built straight from the columns; `mentions` dicts are only built if accessed.
+
+        Args:
+            years (sequence): Mention years.
+            source_types (sequence): Mention source types.
+            sentiments (sequence): Mention sentiments ('Positive', 'Negative' or 'Neutral').
+            entity_a (EntityMetadata): Metadata for entity A.
+            entity_b (EntityMetadata): Metadata for entity B.
+            config (dict, optional): Configuration to score with. Defaults to None (the shared loaded configuration).
+
+        Returns:
+            RelationshipScorer: An initialized scorer instance.
+
+        Raises:
+            ScoringInitializationError: If the columns differ in length or config cannot be loaded.
+        """
+        if not len(years) == len(source_types) == len(sentiments):
+            raise ScoringInitializationError(
+                f"Mention columns differ in length: {len(years)} years, {len(source_types)} source types, {len(sentiments)} sentiments"
+            )
+        scorer = cls.__new__(cls)
+        scorer._mention_columns = (years, source_types, sentiments)
+        scorer.entity_a, scorer.entity_b = entity_a, entity_b
+        if scorer.logger.isEnabledFor(logging.INFO):
+            scorer.logger.info("Initializing RelationshipScorer (column input) for entity pair: %s - %s", scorer.entity_a.id, scorer.entity_b.id)
+
+        scorer._load_config_and_preprocess(config)
+
+        scorer.logger.info("RelationshipScorer initialized successfully.")
+        return scorer
+
+    @classmethod
+    def from_json(cls, json_data: Union[str, bytes]) -> "RelationshipScorer":
+        """
+        Builds a scorer from a JSON document, parsing and validating it in a single step.
+
+        Equivalent to `RelationshipScorer(json.loads(json_data))`, but validates with
+        `INPUT_ADAPTER.validate_json` so the JSON is never materialized as an intermediate dict.
+        Intended for service callers that receive the input as a request body.
+
+        Args:
+            json_data (str | bytes): JSON document with the structure expected by `__init__`.
+
+        Returns:
+            RelationshipScorer: An initialized scorer instance.
+
+        Raises:
+            InputValidationError: If the JSON is malformed or fails validation.
+            ScoringInitializationError: If config cannot be loaded.
+        """
+        scorer = cls.__new__(cls)
+
+        try:
+            validated_input = INPUT_ADAPTER.validate_json(json_data)
+        except ValidationError as e:
+            scorer.logger.error(f"Input data validation failed: {e}", exc_info=scorer.logger.isEnabledFor(logging.DEBUG))
+            raise InputValidationError(e)
+        scorer.mentions = validated_input.relationship_mentions
+        scorer.entity_a = validated_input.entity_a_metadata
+        scorer.entity_b = validated_input.entity_b_metadata
+        if scorer.logger.isEnabledFor(logging.INFO):
+            scorer.logger.info("Initializing RelationshipScorer (JSON input) for entity pair: %s - %s", scorer.entity_a.id, scorer.entity_b.id)
+
+        scorer._load_config_and_preprocess()
+
+        scorer.logger.info("RelationshipScorer initialized successfully.")
+        return scorer
+
+    @staticmethod
+    def _construct_trusted(input_data: Dict[str, Any]) -> Tuple[List[MentionItem], EntityMetadata, EntityMetadata]:
+        """
+        Builds the mention and entity models from trusted input without validation.
 
-        # 2. Load configuration
+        Raises:
+            ScoringInitializationError: If required keys are missing.
+        """
+        # Mentions are plain MentionItem dicts and are used as-is; entity models are built without validation
         try:
-            self.config = load_config() # Reads from config/scoring_config.yaml (or configured path)
+            mentions = list(input_data['relationship_mentions'])
+            entity_a = EntityMetadata.model_construct(**input_data['entity_a_metadata'])
+            entity_b = EntityMetadata.model_construct(**input_data['entity_b_metadata'])
+        except (KeyError, TypeError) as e:
+            raise ScoringInitializationError(f"Trusted input data is missing required structure: {e}")
+        return mentions, entity_a, entity_b
+
+    @classmethod
+    def score_many(cls, inputs: List[Dict[str, Any]], trusted: bool = False, workers: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Calculates the ensemble scores for many relationships in one call.
+
+        Configuration is loaded once and all inputs are validated in a single pass,
+        instead of initializing a separate RelationshipScorer per relationship.
+
+        With `workers` > 1, the validated relationships are split into that many contiguous
+        chunks and scored in parallel worker processes (relationships are independent, and
+        scoring is CPU-bound, so threads would not help). Each worker uses its own loaded
+        configuration: the one inherited from this process where processes are forked,
+        otherwise the config file. Worth it for large batches only, since each worker
+        process must be started and the inputs and results pickled.
+
+        Args:
+            inputs (list): List of input dictionaries, each with the structure expected by `__init__`.
+            trusted (bool): If True, skip Pydantic validation (see `from_trusted`). Defaults to False.
+            workers (int, optional): Number of worker processes to score with. Defaults to None (score in this process).
+
+        Returns:
+            list: One score dictionary per input, in input order, shaped like the output of `get_all_scores`.
+
+        Raises:
+            InputValidationError: If any input fails validation.
+            ScoringInitializationError: If config cannot be loaded or trusted input is malformed.
+            CalculationError: If any underlying score calculation fails.
+        """
+        logger = get_logger()
+        logger.info(f"Batch scoring {len(inputs)} relationships...")
+
+        try:
+            config = cls._get_config()
+        except ConfigurationError as e:
+            logger.error(f"Failed to load configuration: {e}", exc_info=True)
+            raise ScoringInitializationError(f"Failed to load configuration: {e}")
+
+        if trusted:
+            items = [cls._construct_trusted(input_data) for input_data in inputs]
+        else:
+            try:
+                validated_inputs = BATCH_INPUT_ADAPTER.validate_python(inputs)
+            except ValidationError as e:
+                logger.error(f"Input data validation failed: {e}", exc_info=logger.isEnabledFor(logging.DEBUG))
+                raise InputValidationError(e)
+            items = [
+                (item.relationship_mentions, item.entity_a_metadata, item.entity_b_metadata)
+                for item in validated_inputs
+            ]
+
+        # One reference year for the whole batch, so every relationship is scored against the same windows
+        reference_year = datetime.datetime.now().year
+        if workers is not None and workers > 1 and len(items) > 1:
+            chunk_size = -(-len(items) // workers) # Ceiling division: at most `workers` chunks
+            chunks = [items[start:start + chunk_size] for start in range(0, len(items), chunk_size)]
+            results = []
+            with ProcessPoolExecutor(max_workers=len(chunks)) as executor:
+                for chunk_results in executor.map(_score_items_in_worker, chunks, [reference_year] * len(chunks)):
+                    results.extend(chunk_results)
+        else:
+            results = cls._score_items(items, config, reference_year)
+
+        logger.info(f"Successfully calculated scores for {len(results)} relationships.")
+        return results
+
+    @classmethod
+    def _score_items(cls, items: List[Tuple[List[MentionItem], EntityMetadata, EntityMetadata]], config: Dict[str, Any],
+                     reference_year: int) -> List[Dict[str, Any]]:
+        """
+        Scores already validated (mentions, entity A, entity B) items with `config`; the loop behind `score_many`.
+
+        Raises:
+            CalculationError: If any underlying score calculation fails.
+        """
+        logger = get_logger()
+        validate_output = bool(config.get("validate_output", False))
+        use_fused = bool(config.get("fused_scoring", True))
+        source_weights = dict(config.get('source_weights') or {}) # Plain dict: fast per-mention lookups in MentionFeatures
+
+        if use_fused:
+            from .scoring import fused
+        else:
+            from .scoring import evidence, sentiment, trend
+
+        results = []
+        try:
+            for mentions, entity_a, entity_b in items:
+                features = MentionFeatures.from_mentions(mentions, source_weights)
+                if use_fused:
+                    scores_raw = fused.calculate_all(
+                        mentions,
+                        entity_a.overall_prominence,
+                        entity_b.overall_prominence,
+                        config,
+                        features=features,
+                        reference_year=reference_year
+                    )
+                else:
+                    scores_raw = {
+                        "evidence_strength": evidence.calculate(
+                            mentions,
+                            entity_a.overall_prominence,
+                            entity_b.overall_prominence,
+                            config,
+                            features=features
+                        ),
+                        "sentiment_scores": sentiment.calculate(mentions, config, features=features),
+                        "trend_scores": trend.calculate(mentions, config, features=features, reference_year=reference_year)
+                    }
+                results.append(cls._validated_output(scores_raw, logger) if validate_output else scores_raw)
+        except (CalculationError, ConfigurationError) as e:
+            logger.error(f"Failed to batch score relationships due to error in underlying calculation: {e}")
+            raise
+        except Exception as e:
+            logger.error(f"Unexpected error during batch scoring: {e}", exc_info=True)
+            raise CalculationError(f"Unexpected error during batch scoring: {e}")
+        return results
+
+    @staticmethod
+    def _validated_output(scores_raw: Dict[str, Any], logger: Any) -> Dict[str, Any]:
+        """
+        Validates assembled scores against the ScorerOutputData model.
+
+        Raises:
+            OutputValidationError: If the scores fail Pydantic validation.
+        """
+        try:
+            return ScorerOutputData(**scores_raw).model_dump()
+        except ValidationError as e:
+            logger.error(f"Output data validation failed: {e}", exc_info=logger.isEnabledFor(logging.DEBUG))
+            raise OutputValidationError(e)
+
+    @classmethod
+    def _get_config(cls) -> Dict[str, Any]:
+        """
+        Returns the scoring configuration, loading it on first use.
+
+        The loaded config is stashed on the class so later instances skip the loader
+        entirely. Reset `_config_cache` to None to pick up a reloaded configuration.
+
+        Raises:
+            ConfigurationError: If the config file cannot be found or parsed.
+        """
+        if cls._config_cache is None:
+            cls._config_cache = load_config()
+        return cls._config_cache
+
+    @classmethod
+    def warm_up(cls) -> None:
+        """
+        Imports the scoring modules and loads the configuration ahead of the first scoring call.
+
+        The scoring modules are otherwise imported on first use by the getters, so the first
+        scorer in a process pays for them. Latency-sensitive services can call this at startup
+        to move that cost out of the first request. The parsed scoring parameters and the
+        recency decay table for the configured decay rate are built here as well.
+
+        Raises:
+            ConfigurationError: If the config file cannot be found or parsed, or its scoring sections are invalid.
+        """
+        from .scoring import evidence, sentiment, trend, fused, _kernels
+        config = cls._get_config()
+        evidence._get_params(config)
+        sentiment._get_params(config)
+        decay_rate = trend._get_params(config).decay_rate
+        if decay_rate >= 0:
+            _kernels.decay_table(decay_rate)
+
+    def _load_config_and_preprocess(self, config: Optional[Dict[str, Any]] = None):
+        """
+        Loads the scoring configuration (unless `config` is given) and runs data preprocessing.
+
+        Shared by the validating constructor and the trusted construction paths.
+
+        Raises:
+            ScoringInitializationError: If config cannot be loaded or preprocessing fails.
+        """
+        try:
+            self.config = config if config is not None else self._get_config() # Reads from config/scoring_config.yaml (or configured path)
             self.logger.info("Configuration loaded successfully.")
             # Validate loaded config against a schema if needed
+            self._validate_output = bool(self.config.get("validate_output", False))
+            self._fused = bool(self.config.get("fused_scoring", True))
         except ConfigurationError as e:
              self.logger.error(f"Failed to load configuration: {e}", exc_info=True)
              raise ScoringInitializationError(f"Failed to load configuration: {e}") # Re-raise as init error
@@ -80,80 +466,107 @@ class RelationshipScorer:
             self.logger.error(f"Unexpected error loading configuration: {e}", exc_info=True)
             raise ScoringInitializationError(f"Unexpected error loading configuration: {e}")
 
-        # 3. Pre-process data if necessary
         try:
             self._preprocess_data()
         except Exception as e:
             self.logger.error(f"Error during data preprocessing: {e}", exc_info=True)
             raise ScoringInitializationError(f"Error during data preprocessing: {e}")
 
-        self.logger.info("RelationshipScorer initialized successfully.")
-
     def _preprocess_data(self):
         """
-        Placeholder for any data preprocessing needed after validation and config loading.
-        For example, sorting mentions by year, grouping, etc.
+        Preprocesses the validated data once, after validation and config loading.
+
+        Converts the mention list (or `from_columns` columns) into a struct-of-arrays MentionFeatures view (including
+        each mention's configured source weight) that is shared by all score calculations,
+        instead of each one re-reading every mention and re-resolving its weight.
         """
-        self.logger.debug("Running data preprocessing step (currently placeholder)...")
-        # Example: Sort mentions by year if needed by some calculation
-        # self.mentions.sort(key=lambda m: m.year)
-        pass
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Running data preprocessing step...")
+        source_weights = self.config.get('source_weights') or {}
+        if self._mention_columns is not None:
+            self.features = MentionFeatures.from_columns(*self._mention_columns, source_weights)
+        else:
+            self.features = MentionFeatures.from_mentions(self.mentions, source_weights)
 
-    def get_evidence_strength(self) -> float:
-        """Calculates the Evidence Strength score."""
+    # The scores are computed once per scorer (the inputs and config never change after initialization) and
+    # shared by the getters and get_all_scores, which hand out copies of the cached dictionaries so callers
+    # cannot alter later results; treat the properties' dictionaries themselves as read-only.
+    # They let errors propagate: each calculate function already raises CalculationError/ConfigurationError,
+    # and anything else is wrapped once in get_all_scores. Failed calculations are not cached.
+    @cached_property
+    def evidence_strength(self) -> float:
+        """The Evidence Strength score, calculated on first access."""
         self.logger.debug(f"Calculating Evidence Strength for {self.entity_a.id} - {self.entity_b.id}...")
-        try:
-            # Pass necessary components from validated data
-            score = evidence.calculate(
-                self.mentions,
-                self.entity_a.overall_prominence,
-                self.entity_b.overall_prominence,
-                self.config
-            )
-            self.logger.debug(f"Evidence Strength calculated: {score}")
-            return score
-        except (CalculationError, ConfigurationError) as e:
-            # Log expected calculation/config errors and re-raise
-            self.logger.error(f"Error calculating evidence strength: {e}", exc_info=True)
-            raise
-        except Exception as e:
-            # Wrap unexpected errors in CalculationError
-            self.logger.error(f"Unexpected error in evidence strength calculation: {e}", exc_info=True)
-            raise CalculationError(f"Unexpected error in evidence strength: {e}")
+        from .scoring import evidence # Imported on first use (see warm_up)
+        # Pass necessary components from validated data
+        score = evidence.calculate(
+            None, # Scored from `features` (for a from_columns scorer, `mentions` is not built)
+            self.entity_a.overall_prominence,
+            self.entity_b.overall_prominence,
+            self.config,
+            features=self.features
+        )
+        self.logger.debug(f"Evidence Strength calculated: {score}")
+        return score
 
-    def get_sentiment_scores(self) -> Dict[str, Any]:
-        """Calculates the Sentiment Scores (NetScore detailed approach)."""
+    @cached_property
+    def sentiment_scores(self) -> Dict[str, Any]:
+        """The Sentiment Scores (NetScore detailed approach), calculated on first access."""
         self.logger.debug(f"Calculating Sentiment Scores for {self.entity_a.id} - {self.entity_b.id}...")
-        try:
-            scores = sentiment.calculate(self.mentions, self.config)
-            self.logger.debug(f"Sentiment Scores calculated: {scores}")
-            return scores # Should already be a dict from sentiment.calculate
-        except (CalculationError, ConfigurationError) as e:
-            self.logger.error(f"Error calculating sentiment scores: {e}", exc_info=True)
-            raise
-        except Exception as e:
-            self.logger.error(f"Unexpected error in sentiment score calculation: {e}", exc_info=True)
-            raise CalculationError(f"Unexpected error in sentiment scores: {e}")
+        from .scoring import sentiment
+        scores = sentiment.calculate(None, self.config, features=self.features)
+        self.logger.debug(f"Sentiment Scores calculated: {scores}")
+        return scores # Should already be a dict from sentiment.calculate
 
-    def get_trend_score(self) -> float:
-        """Calculates the Trend Score."""
+    @cached_property
+    def trend_scores(self) -> Dict[str, Any]:
+        """The Trend Scores, calculated on first access."""
         self.logger.debug(f"Calculating Trend Score for {self.entity_a.id} - {self.entity_b.id}...")
-        try:
-            score = trend.calculate(self.mentions, self.config)
-            self.logger.debug(f"Trend Score calculated: {score}")
-            return score
-        except (CalculationError, ConfigurationError) as e:
-            self.logger.error(f"Error calculating trend score: {e}", exc_info=True)
-            raise
-        except Exception as e:
-            self.logger.error(f"Unexpected error in trend score calculation: {e}", exc_info=True)
-            raise CalculationError(f"Unexpected error in trend score: {e}")
+        from .scoring import trend
+        scores = trend.calculate(None, self.config, features=self.features)
+        self.logger.debug(f"Trend Score calculated: {scores}")
+        return scores
+
+    def get_evidence_strength(self) -> float:
+        """Calculates the Evidence Strength score (see `evidence_strength`)."""
+        return self.evidence_strength
+
+    def get_sentiment_scores(self) -> Dict[str, Any]:
+        """Calculates the Sentiment Scores (see `sentiment_scores`); returns a copy the caller may modify."""
+        return dict(self.sentiment_scores)
+
+    def get_trend_score(self) -> Dict[str, Any]:
+        """Calculates the Trend Scores (see `trend_scores`); returns a copy the caller may modify."""
+        return dict(self.trend_scores)
+
+    def _cache_fused_scores(self) -> None:
+        """ Computes all scores in one fused pass, unless all are cached already, and caches those not yet cached. """
+        cached = vars(self) # cached_property values live in the instance dict
+        if "evidence_strength" in cached and "sentiment_scores" in cached and "trend_scores" in cached:
+            return
+        # Single pass over the mentions for all scores
+        from .scoring import fused
+        scores = fused.calculate_all(
+            None, # Scored from `features`
+            self.entity_a.overall_prominence,
+            self.entity_b.overall_prominence,
+            self.config,
+            features=self.features
+        )
+        for name, value in scores.items(): # Keys match the score property names
+            cached.setdefault(name, value)
 
     def get_all_scores(self) -> Dict[str, Any]:
         """
         Calculates and returns all ensemble scores in a dictionary.
 
-        Performs optional output validation using the ScorerOutputData model.
+        The scores are computed on the first call and cached on the scorer, like the individual
+        score properties, so repeat calls only assemble (copies of) the cached values. When
+        `fused_scoring` is enabled in the configuration (the default), the scores not cached yet
+        are all computed in a single pass over the mentions by `scoring.fused.calculate_all`,
+        which also fills the `evidence_strength`, `sentiment_scores` and `trend_scores`
+        properties; otherwise each missing property is calculated individually. Output validation
+        against the ScorerOutputData model is only performed (on every call) when `validate_output` is enabled.
 
         Returns:
             dict: A dictionary containing 'evidence_strength', 'sentiment_scores', and 'trend_score'.
@@ -164,26 +577,24 @@ class RelationshipScorer:
         """
         self.logger.info(f"Calculating all ensemble scores for {self.entity_a.id} - {self.entity_b.id}...")
         try:
-            # Calculate all individual scores
-            evidence_score = self.get_evidence_strength()
-            sentiment_score_dict = self.get_sentiment_scores()
-            trend_score_val = self.get_trend_score()
-
-            # Assemble raw results
+            if self._fused:
+                self._cache_fused_scores()
+            # Assemble copies of the (cached) scores
             scores_raw = {
-                "evidence_strength": evidence_score,
-                "sentiment_scores": sentiment_score_dict,
-                "trend_scores": trend_score_val
+                "evidence_strength": self.evidence_strength,
+                "sentiment_scores": self.get_sentiment_scores(),
+                "trend_scores": self.get_trend_score()
             }
 
+            # Output is assembled in-process from known keys, so validation is opt-in (debugging aid)
+            if not self._validate_output:
+                self.logger.info("Successfully calculated all scores.")
+                return scores_raw
+
             # --- Validate final output ---
-            try:
-                validated_output = ScorerOutputData(**scores_raw)
-                self.logger.info("Successfully calculated and validated all scores.")
-                return validated_output.model_dump()
-            except ValidationError as e:
-                self.logger.error(f"Output data validation failed: {e}. Returning raw data.", exc_info=True)
-                raise OutputValidationError(e)
+            validated_output = self._validated_output(scores_raw, self.logger)
+            self.logger.info("Successfully calculated and validated all scores.")
+            return validated_output
 
         except (CalculationError, ConfigurationError) as e:
             self.logger.error(f"Failed to calculate all scores due to error in underlying calculation: {e}")
@@ -192,3 +603,29 @@ class RelationshipScorer:
             self.logger.error(f"Unexpected error assembling final scores: {e}", exc_info=True)
             raise CalculationError(f"Unexpected error assembling final scores: {e}")
 
+    def get_all_scores_json(self) -> bytes:
+        """
+        Calculates all ensemble scores and returns them serialized as JSON.
+
+        Same content as `get_all_scores`, for services that send the scores straight to a
+        client (the bytes can be returned as a response body as-is). Uses orjson when it is
+        installed (`pip install "relationship_scorer[json]"`), and the standard library
+        json module otherwise.
+
+        Returns:
+            bytes: UTF-8 encoded JSON object with the keys returned by `get_all_scores`.
+
+        Raises:
+            CalculationError: If any underlying score calculation fails.
+            OutputValidationError: If the final assembled output fails Pydantic validation.
+        """
+        return _dumps_json(self.get_all_scores())
+
+def _score_items_in_worker(items: List[Tuple[List[MentionItem], EntityMetadata, EntityMetadata]],
+                           reference_year: int) -> List[Dict[str, Any]]:
+    """ Worker-process entry point for `RelationshipScorer.score_many(..., workers=n)`: scores one chunk of items. """
+    try:
+        config = RelationshipScorer._get_config()
+    except ConfigurationError as e:
+        raise ScoringInitializationError(f"Failed to load configuration in worker process: {e}")
+    return RelationshipScorer._score_items(items, config, reference_year)
@@ -1,9 +1,29 @@
-from . import evidence
-from . import sentiment
-from . import trend
+# Scoring modules are imported lazily (PEP 562) so callers only pay for the ones they use.
 
-from .evidence import calculate as evidence_calculate
-from .sentiment import calculate as sentiment_calculate
-from .trend import calculate as trend_calculate
+import importlib
 
-__all__ = ['evidence_calculate', 'sentiment_calculate', 'trend_calculate']
+_SUBMODULES = ('evidence', 'sentiment', 'trend', 'fused')
+
+# Public alias -> (submodule, attribute)
+_CALCULATE_ALIASES = {
+    'evidence_calculate': ('evidence', 'calculate'),
+    'sentiment_calculate': ('sentiment', 'calculate'),
+    'trend_calculate': ('trend', 'calculate'),
+    'fused_calculate_all': ('fused', 'calculate_all'),
+}
+
+__all__ = ['evidence_calculate', 'sentiment_calculate', 'trend_calculate', 'fused_calculate_all', 'evidence', 'sentiment', 'trend', 'fused']
+
+def __getattr__(name):
+    """ Imports scoring submodules (and their calculate aliases) on first access. """
+    if name in _SUBMODULES:
+        return importlib.import_module(f'.{name}', __name__)
+    if name in _CALCULATE_ALIASES:
+        module_name, attr = _CALCULATE_ALIASES[name]
+        value = getattr(importlib.import_module(f'.{module_name}', __name__), attr)
+        globals()[name] = value # Cache so later lookups bypass __getattr__
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
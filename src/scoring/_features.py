@@ -0,0 +1,72 @@
+# src/scoring/_features.py
+# Column-oriented (struct-of-arrays) view of a relationship's mentions, shared by the scoring modules.
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+from ..data_models.models import MentionItem
+
+# --- Sentiment Codes ---
+# Sentiments are integer-coded once so the scoring loops compare small ints instead of strings
+POSITIVE, NEGATIVE, NEUTRAL = 0, 1, 2
+UNKNOWN_SENTIMENT = -1 # Only reachable via unvalidated (trusted) input
+SENTIMENT_CODES = {"Positive": POSITIVE, "Negative": NEGATIVE, "Neutral": NEUTRAL}
+
+@dataclass(frozen=True)
+class MentionFeatures:
+    """
+    Struct-of-arrays view of a list of mentions.
+
+    Each attribute is a tuple with one entry per mention, in the original mention order.
+    Built once per relationship and passed to evidence/sentiment/trend `calculate`, so the
+    scoring loops iterate flat columns instead of re-reading every mention dict.
+
+    `weights` holds each mention's configured source weight (None if its source type is not
+    configured), gathered once from the 'source_weights' config so the scoring loops need no
+    per-mention dict lookups. Features must be built from the same config used for scoring.
+    (The 'source_weights' dict itself serves as the per-config weight table: a dense
+    type->index->weight table would cost two lookups per mention instead of one.)
+    """
+    years: Tuple[int, ...]
+    source_types: Tuple[str, ...]
+    sentiments: Tuple[int, ...] # SENTIMENT_CODES values
+    weights: Tuple[Optional[float], ...]
+
+    def __len__(self) -> int:
+        return len(self.years)
+
+    @classmethod
+    def from_mentions(cls, mentions: List[MentionItem], source_weights: Dict[str, float]) -> "MentionFeatures":
+        """
+        Extracts the feature columns from a list of MentionItem dicts.
+
+        Args:
+            mentions: List of MentionItem dicts for the relationship.
+            source_weights: The 'source_weights' config mapping source_type to its weight (any Mapping).
+        """
+        return cls.from_columns(
+            (m['year'] for m in mentions),
+            (m['source_type'] for m in mentions),
+            (m['sentiment'] for m in mentions),
+            source_weights
+        )
+
+    @classmethod
+    def from_columns(cls, years: Iterable[int], source_types: Iterable[str], sentiments: Iterable[str],
+                     source_weights: Dict[str, float]) -> "MentionFeatures":
+        """
+        Builds the feature columns from per-field mention columns of equal length (no per-mention dicts).
+
+        Args:
+            years, source_types, sentiments: The mentions' MentionItem field values, in mention order.
+            source_weights: The 'source_weights' config mapping source_type to its weight (any Mapping).
+        """
+        if not isinstance(source_weights, dict):
+            source_weights = dict(source_weights) # e.g. the read-only loaded config: dict.get is much faster to map
+        sentiment_code = SENTIMENT_CODES.get
+        source_types = tuple(source_types)
+        return cls(
+            years=tuple(years),
+            source_types=source_types,
+            sentiments=tuple(sentiment_code(sentiment, UNKNOWN_SENTIMENT) for sentiment in sentiments),
+            weights=tuple(map(source_weights.get, source_types)),
+        )
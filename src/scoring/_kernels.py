@@ -0,0 +1,155 @@
+# src/scoring/_kernels.py
+# Tight accumulation loops over MentionFeatures columns, kept free of logging and config access.
+
+import math
+import sys
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional, Sequence, Set, Tuple
+from ._features import POSITIVE, NEGATIVE, NEUTRAL
+
+# Largest x for which math.exp(x) does not overflow (~709.78)
+MAX_DECAY_EXPONENT = math.log(sys.float_info.max)
+
+# Decay tables cover ages 0 .. _DECAY_TABLE_SIZE - 1 (validated years start at 1901); older mentions use exp directly
+_DECAY_TABLE_SIZE = 256
+
+# Decay rates are config constants, so a handful of tables covers every live config (as in _params)
+@lru_cache(maxsize=8)
+def decay_table(decay_rate: float) -> Tuple[float, ...]:
+    """ Returns exp(-decay_rate * age) for ages 0 .. _DECAY_TABLE_SIZE - 1 (memoized per decay rate; decay_rate >= 0). """
+    exp = math.exp
+    neg_decay = -decay_rate
+    return tuple([exp(neg_decay * age) for age in range(_DECAY_TABLE_SIZE)])
+
+def recency_sum(weights: Sequence[float], ages: Sequence[int], decay_rate: float) -> float:
+    """
+    Sums weight * exp(-decay_rate * age) over parallel weight/age columns.
+
+    With a non-negative decay rate, integer ages below _DECAY_TABLE_SIZE are looked up in a
+    precomputed `decay_table` instead of calling exp per mention; the table holds the same exp
+    values, so the sum is unchanged. With a negative decay rate, callers must first drop the
+    mentions with -decay_rate * age > MAX_DECAY_EXPONENT, or exp raises OverflowError.
+    """
+    if not ages:
+        return 0.0
+    total = 0.0
+    if decay_rate >= 0 and max(ages) < _DECAY_TABLE_SIZE:
+        table = decay_table(decay_rate)
+        try:
+            for weight, age in zip(weights, ages):
+                total += weight * table[age]
+            return total
+        except TypeError:
+            total = 0.0 # Non-integer ages (unvalidated input): use exp below
+
+    exp = math.exp
+    neg_decay = -decay_rate
+    for weight, age in zip(weights, ages):
+        total += weight * exp(neg_decay * age)
+    return total
+
+class FusedAccumulators(NamedTuple):
+    """ Per-relationship sums produced by `fused_scores`, plus the mentions the caller should warn about. """
+    weighted_sum: float
+    mentions_by_type: Dict[str, int]
+    positive_score: float
+    negative_score: float
+    neutral_score: float
+    recency_score: float
+    current_window_score: float
+    previous_window_score: float
+    max_historical_weight: float
+    recent_source_types: Set[str]
+    unconfigured: List[str]                 # source_type of each mention without a configured weight
+    overflowed: List[Tuple[int, int]]       # (year, age) of mentions whose decay factor overflowed
+    zero_weight_in_window: List[Tuple[str, int]] # (source_type, year) of zero-weight mentions inside a window
+
+def fused_scores(years: Sequence[int], source_types: Sequence[str], sentiments: Sequence[int], weights: Sequence[Optional[float]],
+                 decay_rate: float, current_year: int, window_bounds: Tuple[int, int, int, int],
+                 recent_start_year: Optional[int]) -> FusedAccumulators:
+    """
+    Accumulates every per-mention statistic used by the fused scoring path in one loop.
+
+    Args:
+        years, source_types, sentiments, weights: The MentionFeatures columns.
+        decay_rate: Exponential decay rate for the recency-weighted trend.
+        current_year: Reference year for ages and windows.
+        window_bounds: Rate-of-change window bounds, as returned by `trend._window_bounds`.
+        recent_start_year: First year of the evidence-progression recent period, or None to skip progression.
+
+    Returns:
+        FusedAccumulators with the raw sums; diagnostics are returned instead of logged so the loop stays tight.
+    """
+    current_start, current_end, previous_start, _ = window_bounds
+    exp = math.exp
+    neg_decay = -decay_rate
+    track_progression = recent_start_year is not None
+    can_overflow = decay_rate < 0 # Decay factors can only overflow with a negative decay rate
+    # Ages below table_size read their decay factor from the table (none with a negative decay rate)
+    table_size = 0 if can_overflow else _DECAY_TABLE_SIZE
+    table = () if can_overflow else decay_table(decay_rate)
+
+    weighted_sum = 0.0
+    mentions_by_type = {}
+    positive_score = negative_score = neutral_score = 0.0
+    recency_score = 0.0
+    current_window_score = previous_window_score = 0.0
+    max_historical_weight = -1.0
+    recent_source_types = set()
+    unconfigured = []
+    overflowed = []
+    zero_weight_in_window = []
+
+    for year, source_type, sentiment_code, weight in zip(years, source_types, sentiments, weights):
+        if weight is None:
+            unconfigured.append(source_type)
+            continue
+
+        # Evidence strength
+        weighted_sum += weight
+        mentions_by_type[source_type] = mentions_by_type.get(source_type, 0) + 1
+
+        # Sentiment
+        if sentiment_code == POSITIVE:
+            positive_score += weight
+        elif sentiment_code == NEGATIVE:
+            negative_score += weight
+        elif sentiment_code == NEUTRAL:
+            neutral_score += weight
+
+        # Trend: recency weighted
+        age = current_year - year
+        if age < 0:
+            age = 0
+        if age < table_size:
+            try:
+                recency_score += weight * table[age]
+            except TypeError:
+                recency_score += weight * exp(neg_decay * age) # Non-integer age (unvalidated input), as in recency_sum
+        elif can_overflow and neg_decay * age > MAX_DECAY_EXPONENT:
+            overflowed.append((year, age))
+        else:
+            recency_score += weight * exp(neg_decay * age)
+
+        # Trend: rate of change (the two windows are contiguous: (previous_start, current_end])
+        if previous_start < year <= current_end:
+            if year > current_start:
+                current_window_score += weight
+            else:
+                previous_window_score += weight
+            if weight == 0.0:
+                zero_weight_in_window.append((source_type, year))
+
+        # Trend: evidence progression
+        if track_progression:
+            if year < recent_start_year:
+                if weight > max_historical_weight:
+                    max_historical_weight = weight
+            elif weight > 0:
+                recent_source_types.add(source_type)
+
+    return FusedAccumulators(
+        weighted_sum, mentions_by_type, positive_score, negative_score, neutral_score, recency_score,
+        current_window_score, previous_window_score, max_historical_weight, recent_source_types,
+        unconfigured, overflowed, zero_weight_in_window
+    )
@@ -0,0 +1,64 @@
+# src/scoring/_params.py
+# Typed, parsed views of the scoring configuration, cached per config object.
+
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar
+
+P = TypeVar("P")
+
+@dataclass(frozen=True)
+class EvidenceParams:
+    """ Parsed 'evidence_strength' settings. """
+    weights: Dict[str, float]
+    aggregation_method: str
+    normalization_method: str
+
+@dataclass(frozen=True)
+class SentimentParams:
+    """ Parsed 'sentiment' settings. """
+    weights: Dict[str, float]
+
+@dataclass(frozen=True)
+class TrendParams:
+    """
+    Parsed 'trend' settings, with defaults applied.
+
+    recent_years_threshold/progression_points/progression_tiers are None when the
+    evidence_progression config is invalid, in which case the progression score is 0.
+    progression_tiers maps each configured source_type to its (weight, points) pair, with
+    points None when progression_points has no valid numeric entry for it.
+    """
+    weights: Dict[str, float]
+    decay_rate: float
+    window_years: float
+    recent_years_threshold: Optional[float]
+    progression_points: Optional[Dict[str, Any]]
+    progression_tiers: Optional[Dict[str, Tuple[float, Optional[float]]]]
+
+# At most this many parsed entries are kept; configs are reloaded rarely, usually one is live
+_CACHE_SIZE = 8
+_cache: Dict[Tuple[int, Callable], Tuple[Dict[str, Any], Any]] = {}
+
+def cached_params(config: Dict[str, Any], parse: Callable[[Dict[str, Any]], P]) -> P:
+    """
+    Returns `parse(config)`, parsing each config object only once.
+
+    Entries are keyed by the config's identity and hold a reference to it, so an id can
+    never be reused by a different dict while its entry is cached. The loaded configuration
+    is treated as read-only: mutating a config in place after it has been used for scoring
+    is not picked up. Parse errors are not cached, so they are raised on every call.
+
+    Args:
+        config: The loaded configuration dictionary.
+        parse: Module-level function building the params object from `config`.
+    """
+    key = (id(config), parse)
+    entry = _cache.get(key)
+    if entry is not None and entry[0] is config:
+        return entry[1]
+
+    params = parse(config)
+    if len(_cache) >= _CACHE_SIZE:
+        _cache.pop(next(iter(_cache))) # Evict the oldest entry
+    _cache[key] = (config, params)
+    return params
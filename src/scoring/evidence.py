@@ -2,20 +2,24 @@
 # Calculates the Evidence Strength score.
 
 import math
-from typing import List, Dict, Any
+from collections import Counter
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Sequence
 from ..data_models.models import MentionItem # Import the Pydantic model for type hinting
+from ._features import MentionFeatures
+from ._params import EvidenceParams, cached_params
 from ..utils.logger import get_logger
 from ..exceptions import CalculationError, ConfigurationError
 
 logger = get_logger()
 
-def _calculate_raw_weighted_frequency(mentions: List[MentionItem], weights: Dict[str, float], aggregation_method: str) -> float:
+def _calculate_raw_weighted_frequency(features: MentionFeatures, weights: Dict[str, float], aggregation_method: str) -> float:
     """
     Calculates the raw score based on mention counts and source weights,
     before normalization.
 
     Args:
-        mentions: List of MentionItem objects for the relationship.
+        features: MentionFeatures for the relationship (uses 'source_types' and 'weights').
         weights: Dictionary mapping source_type to its weight.
         aggregation_method: Method to use ('Logarithmic' or 'SimpleSum').
 
@@ -24,47 +28,107 @@ def _calculate_raw_weighted_frequency(mentions: List[MentionItem], weights: Dict
 
     Raises:
         ConfigurationError: If an invalid aggregation method is specified.
-        KeyError: If a mention's source_type is not found in weights.
     """
-    logger.debug(f"Calculating raw weighted frequency using method: {aggregation_method}")
+    logger.debug("Calculating raw weighted frequency using method: %s", aggregation_method)
     raw_score = 0.0
 
+    # Mentions with unconfigured source types (weight None) are skipped; warn once per call
+    skipped = features.weights.count(None)
+    if skipped:
+        skipped_types = sorted({source_type for source_type, weight in zip(features.source_types, features.weights) if weight is None})
+        logger.warning(f"{skipped} mention(s) with source types not found in configured weights skipped: {skipped_types}")
+        # Or raise ConfigurationError("Missing weight for source type...") ? Decide on strictness.
+
     if aggregation_method == "SimpleSum":
-        for mention in mentions:
-            try:
-                raw_score += weights[mention.source_type]
-            except KeyError:
-                logger.warning(f"Source type '{mention.source_type}' not found in configured weights. Mention skipped.")
-                # Or raise ConfigurationError("Missing weight for source type...") ? Decide on strictness.
+        for weight in features.weights:
+            if weight is not None:
+                raw_score += weight
 
     elif aggregation_method == "Logarithmic":
-        # Group mentions by source type first
-        mentions_by_type = {}
-        for mention in mentions:
-            source_type = mention.source_type
-            if source_type not in weights:
-                 logger.warning(f"Source type '{source_type}' not found in configured weights. Mention skipped.")
-                 continue # Skip mentions with unconfigured source types
-
-            if source_type not in mentions_by_type:
-                mentions_by_type[source_type] = 0
-            mentions_by_type[source_type] += 1
-
-        # Apply logarithmic aggregation: weight * log(1 + count)
-        for source_type, count in mentions_by_type.items():
-            weight = weights[source_type]
-            raw_score += weight * math.log1p(count) # log1p(x) calculates log(1 + x) accurately
+        # Group mentions by source type first (Counter keeps first-seen order, so the sum order is stable)
+        if skipped:
+            mentions_by_type = Counter(source_type for source_type, weight in zip(features.source_types, features.weights) if weight is not None)
+        else:
+            mentions_by_type = Counter(features.source_types)
+
+        raw_score = _aggregate_logarithmic(mentions_by_type, weights)
 
     else:
         raise ConfigurationError(f"Invalid frequency aggregation method specified: {aggregation_method}")
 
-    logger.debug(f"Calculated raw weighted frequency: {raw_score}")
+    logger.debug("Calculated raw weighted frequency: %s", raw_score)
+    return raw_score
+
+def _aggregate_logarithmic(mentions_by_type: Dict[str, int], weights: Dict[str, float]) -> float:
+    """
+    Applies logarithmic aggregation to per-source-type mention counts: sum of weight * log(1 + count).
+
+    Args:
+        mentions_by_type: Dictionary mapping each configured source_type to its mention count.
+        weights: Dictionary mapping source_type to its weight.
+    """
+    # One term per distinct source type (the histogram), not per mention
+    log1p = math.log1p # log1p(x) calculates log(1 + x) accurately
+    raw_score = 0.0
+    for source_type, count in mentions_by_type.items():
+        raw_score += weights[source_type] * log1p(count)
     return raw_score
 
+def _raw_score_from_aggregates(weighted_sum: float, mentions_by_type: Dict[str, int], weights: Dict[str, float], aggregation_method: str) -> float:
+    """
+    Computes the raw weighted frequency score from aggregates accumulated elsewhere (e.g., a fused pass).
+
+    Args:
+        weighted_sum: Sum of source weights over all configured mentions (used by 'SimpleSum').
+        mentions_by_type: Dictionary mapping each configured source_type to its mention count (used by 'Logarithmic').
+        weights: Dictionary mapping source_type to its weight.
+        aggregation_method: Method to use ('Logarithmic' or 'SimpleSum').
+
+    Raises:
+        ConfigurationError: If an invalid aggregation method is specified.
+    """
+    if aggregation_method == "SimpleSum":
+        return weighted_sum
+    if aggregation_method == "Logarithmic":
+        return _aggregate_logarithmic(mentions_by_type, weights)
+    raise ConfigurationError(f"Invalid frequency aggregation method specified: {aggregation_method}")
+
+def _parse_params(config: Dict[str, Any]) -> EvidenceParams:
+    """
+    Extracts the evidence strength settings from the configuration.
+
+    Use `_get_params` instead, which parses each config only once.
+
+    Raises:
+        ConfigurationError: If required sections or keys are missing.
+    """
+    evidence_config = config.get('evidence_strength', {})
+    weights = config.get('source_weights', {})
+    if not evidence_config or not weights:
+         raise ConfigurationError("Missing 'evidence_strength' or 'source_weights' in configuration.")
+
+    aggregation_method = evidence_config.get('frequency_aggregation')
+    normalization_method = evidence_config.get('normalization_method')
+    if not aggregation_method or not normalization_method:
+         raise ConfigurationError("Missing 'frequency_aggregation' or 'normalization_method' in evidence_strength config.")
+    return EvidenceParams(weights, aggregation_method, normalization_method)
+
+def _get_params(config: Dict[str, Any]) -> EvidenceParams:
+    """ Returns the parsed evidence strength settings for `config` (cached per config object). """
+    return cached_params(config, _parse_params)
+
+# Bounds the PMI memo; each entry is one (raw_score, prominence A, prominence B, scale) key
+_PMI_CACHE_SIZE = 65536
+
+@lru_cache(maxsize=_PMI_CACHE_SIZE)
 def calculate_pmi(raw_score: float, entity_a_prominence: float, entity_b_prominence: float, total_count_or_scale: float = 1e6) -> float:
     """
     Calculates the Pointwise Mutual Information (PMI) score, clipped at 0.
 
+    Memoized on the exact arguments: relationships involving the same hub entities often
+    repeat the same (raw score, prominence) triples. Call `calculate_pmi.cache_clear()` to
+    drop the memo between scoring runs. Keys are not rounded, so results are unchanged.
+
     Args:
         raw_score: Score representing the co-occurrence of A and B (proportional to Count(A,B)).
         entity_a_prominence: Score representing the occurrence of A (proportional to Count(A)).
@@ -88,11 +152,105 @@ def calculate_pmi(raw_score: float, entity_a_prominence: float, entity_b_promine
         # Negative PMI means co-occurrence is less likely than expected.
         # Often, only positive associations are of interest, so clip at 0.
         return max(0.0, pmi_value)
-    except (ValueError, OverflowError) as e:
-        # Catch potential math errors like log of a non-positive number (though ideally prevented by the initial check)
+    except (ValueError, OverflowError, ZeroDivisionError) as e:
+        # Catch potential math errors like log of a non-positive number (though ideally prevented by the initial check),
+        # or the prominence product underflowing to 0
         logger.error(f"Error calculating PMI for scores ({raw_score}, {entity_a_prominence}, {entity_b_prominence}): {e}")
         return 0.0
 
+def calculate_npmi(raw_score: float, entity_a_prominence: float, entity_b_prominence: float, total_count: float = 1e6) -> float:
+    """
+    Calculates the Normalized PMI (NPMI) score, clipped to [0, 1].
+
+    NPMI = PMI / -log p(A,B) = log(p(A) * p(B)) / log p(A,B) - 1, with probabilities
+    estimated as p(X) = score / total_count. NPMI only stays <= 1 while p(A,B) <= min(p(A), p(B));
+    the weighted raw score is not bounded by the prominences, so larger co-occurrence scores
+    (which would exceed 1) are clipped to 1. Unlike `calculate_pmi`, the result is thus bounded
+    in [0, 1] and far less sensitive to the magnitude of total_count.
+
+    Args:
+        raw_score: Score representing the co-occurrence of A and B (proportional to Count(A,B)).
+        entity_a_prominence: Score representing the occurrence of A (proportional to Count(A)).
+        entity_b_prominence: Score representing the occurrence of B (proportional to Count(B)).
+        total_count: Total number of events/documents (N) used to turn scores into probabilities.
+
+    Returns:
+        The calculated NPMI score (at most 1.0), or 0.0 if inputs are invalid or NPMI is negative.
+    """
+    p_ab = raw_score / total_count
+    p_a = entity_a_prominence / total_count
+    p_b = entity_b_prominence / total_count
+    # NPMI requires 0 < p(A,B) < 1 (log p(A,B) must be strictly negative) and positive marginals
+    if not 0.0 < p_ab < 1.0 or p_a <= 0 or p_b <= 0:
+        return 0.0
+
+    try:
+        npmi_value = math.log(p_a * p_b) / math.log(p_ab) - 1.0
+        return min(1.0, max(0.0, npmi_value))
+    except (ValueError, OverflowError, ZeroDivisionError) as e:
+        # e.g., p(A) * p(B) underflowing to 0
+        logger.error(f"Error calculating NPMI for scores ({raw_score}, {entity_a_prominence}, {entity_b_prominence}): {e}")
+        return 0.0
+
+def calculate_pmi_batch(raw_scores: Sequence[float], entity_a_prominences: Sequence[float], entity_b_prominences: Sequence[float],
+                        total_count_or_scale: float = 1e6) -> List[float]:
+    """
+    Calculates clipped PMI scores for many relationships at once.
+
+    Element-wise equivalent of `calculate_pmi` over parallel sequences (same clipping and
+    same 0.0 result for non-positive inputs), evaluated in a single comprehension instead
+    of one function call per relationship.
+
+    Args:
+        raw_scores: Raw weighted frequency score per relationship.
+        entity_a_prominences: Entity A prominence per relationship.
+        entity_b_prominences: Entity B prominence per relationship.
+        total_count_or_scale: Scaling factor N, as in `calculate_pmi`.
+
+    Returns:
+        List of PMI scores, one per relationship, in input order.
+    """
+    log = math.log
+    try:
+        return [
+            max(0.0, log((raw * total_count_or_scale) / (a * b))) if raw > 0 and a > 0 and b > 0 else 0.0
+            for raw, a, b in zip(raw_scores, entity_a_prominences, entity_b_prominences)
+        ]
+    except (ValueError, OverflowError, ZeroDivisionError):
+        # Rare (ratio or prominence product underflow/overflow): recompute per relationship so only the offending ones fall back to 0
+        return [calculate_pmi(raw, a, b, total_count_or_scale) for raw, a, b in zip(raw_scores, entity_a_prominences, entity_b_prominences)]
+
+def _normalize_none(raw_score: float, entity_a_prominence: float, entity_b_prominence: float) -> float:
+    """ 'None' normalization: the raw score is used as-is. """
+    return raw_score
+
+def _normalize_relative_frequency(raw_score: float, entity_a_prominence: float, entity_b_prominence: float) -> float:
+    """ 'RelativeFrequency' normalization: the raw score relative to the average prominence of the two entities. """
+    # Variants: Normalize by min(A, B), max(A, B), or just A or B. Configurable?
+    # Need to prevent division by zero.
+    avg_prominence = (entity_a_prominence + entity_b_prominence) / 2.0
+    if avg_prominence == 0:
+         logger.error("Cannot normalize using RelativeFrequency with zero average entity prominence.")
+         # Fallback to raw score or raise error? Let's return raw score with warning.
+         logger.warning("Falling back to un-normalized score due to zero average prominence.")
+         return raw_score
+    # Simple ratio - might need scaling or logarithmic adjustments depending on score distribution
+    return raw_score / avg_prominence
+    # Placeholder: Add scaling/log if needed, e.g., math.log1p(raw_score / avg_prominence)
+
+# Normalization method name -> function(raw_score, entity_a_prominence, entity_b_prominence).
+# 'PMI-like' measures how much more likely the co-occurrence (raw_score) is than would be
+# expected if occurrences (prominence scores) were independent; its interpretation requires
+# understanding how raw_score and prominence relate to corpus counts, and the default scaling
+# factor in calculate_pmi might need adjustment. 'NPMI' is bounded and less sensitive to that
+# choice of total count.
+_NORMALIZATION_METHODS = {
+    "None": _normalize_none,
+    "RelativeFrequency": _normalize_relative_frequency,
+    "PMI-like": calculate_pmi,
+    "NPMI": calculate_npmi,
+}
+
 def _apply_normalization(raw_score: float, entity_a_prominence: float, entity_b_prominence: float, total_mentions: int, method: str) -> float:
     """
     Applies normalization to the raw score to mitigate entity prominence bias.
@@ -102,7 +260,7 @@ def _apply_normalization(raw_score: float, entity_a_prominence: float, entity_b_
         entity_a_prominence: Overall prominence score for entity A.
         entity_b_prominence: Overall prominence score for entity B.
         total_mentions: Total number of mentions for this specific relationship.
-        method: Normalization method ('PMI-like', 'RelativeFrequency', 'None').
+        method: Normalization method ('PMI-like', 'NPMI', 'RelativeFrequency', 'None').
 
     Returns:
         The normalized evidence strength score.
@@ -111,7 +269,7 @@ def _apply_normalization(raw_score: float, entity_a_prominence: float, entity_b_
         ConfigurationError: If an invalid normalization method is specified.
         CalculationError: For potential issues like division by zero if inputs are invalid.
     """
-    logger.debug(f"Applying normalization method: {method}")
+    logger.debug("Applying normalization method: %s", method)
 
     # Ensure prominence scores are valid for calculations
     if entity_a_prominence <= 0 or entity_b_prominence <= 0:
@@ -121,55 +279,33 @@ def _apply_normalization(raw_score: float, entity_a_prominence: float, entity_b_
          # Option 3: Raise an error
          logger.warning(f"Entity prominence scores must be positive for normalization (A: {entity_a_prominence}, B: {entity_b_prominence}). Normalization might be inaccurate or skipped.")
          # For now, let's default to skipping normalization if prominence is invalid
-         if method in ["PMI-like", "RelativeFrequency"]:
+         if method in ["PMI-like", "NPMI", "RelativeFrequency"]:
               method = "None"
 
 
-    if method == "None":
-        normalized_score = raw_score
-    elif method == "RelativeFrequency":
-        # Example: Normalize by the average prominence of the two entities.
-        # Variants: Normalize by min(A, B), max(A, B), or just A or B. Configurable?
-        # Need to prevent division by zero.
-        avg_prominence = (entity_a_prominence + entity_b_prominence) / 2.0
-        if avg_prominence == 0:
-             logger.error("Cannot normalize using RelativeFrequency with zero average entity prominence.")
-             # Fallback to raw score or raise error? Let's return raw score with warning.
-             logger.warning("Falling back to un-normalized score due to zero average prominence.")
-             normalized_score = raw_score
-        else:
-             # Simple ratio - might need scaling or logarithmic adjustments depending on score distribution
-             normalized_score = raw_score / avg_prominence
-             # Placeholder: Add scaling/log if needed, e.g., math.log1p(raw_score / avg_prominence)
-
-    elif method == "PMI-like":
-        # Calculate Pointwise Mutual Information-like score.
-        # This measures how much more likely the co-occurrence (raw_score) is
-        # than would be expected if occurrences (prominence scores) were independent.
-        # Note: The interpretation requires understanding how raw_score and prominence
-        # relate to counts and probabilities in the corpus.
-        # The default scaling factor in calculate_pmi might need adjustment.
-        normalized_score = calculate_pmi(raw_score, entity_a_prominence, entity_b_prominence)
-
-    else:
+    normalize = _NORMALIZATION_METHODS.get(method)
+    if normalize is None:
         raise ConfigurationError(f"Invalid normalization method specified: {method}")
+    normalized_score = normalize(raw_score, entity_a_prominence, entity_b_prominence)
 
-    logger.debug(f"Calculated normalized score: {normalized_score}")
+    logger.debug("Calculated normalized score: %s", normalized_score)
     # Consider adding clamping or scaling if scores vary wildly
     # e.g., return max(0, min(100, normalized_score)) # If scores should be within a range
     return normalized_score
 
-def calculate(mentions: List[MentionItem], entity_a_prominence: float, entity_b_prominence: float, config: Dict[str, Any]) -> float:
+def calculate(mentions: Optional[List[MentionItem]], entity_a_prominence: float, entity_b_prominence: float, config: Dict[str, Any],
+              features: Optional[MentionFeatures] = None) -> float:
     """
     Calculates the Evidence Strength score for the relationship.
 
     Orchestrates the calculation of raw weighted frequency and applies normalization.
 
     Args:
-        mentions: List of MentionItem objects for the relationship.
+        mentions: List of MentionItem dicts for the relationship (may be None when `features` is given).
         entity_a_prominence: Overall prominence score for entity A.
         entity_b_prominence: Overall prominence score for entity B.
         config: The loaded configuration dictionary.
+        features: Optional pre-extracted MentionFeatures for the mentions (built from `mentions` here if omitted).
 
     Returns:
         The final Evidence Strength score (float).
@@ -179,33 +315,32 @@ def calculate(mentions: List[MentionItem], entity_a_prominence: float, entity_b_
         ConfigurationError: If config is invalid or missing required keys.
     """
     logger.info("Calculating Evidence Strength score...")
-    if not mentions:
+    mention_count = len(features) if features is not None else len(mentions or ())
+    if not mention_count:
         logger.warning("No mentions provided for evidence strength calculation. Returning 0.")
         return 0.0
 
     try:
         # --- Get relevant config sections ---
-        evidence_config = config.get('evidence_strength', {})
-        weights = config.get('source_weights', {})
-        if not evidence_config or not weights:
-             raise ConfigurationError("Missing 'evidence_strength' or 'source_weights' in configuration.")
-
-        aggregation_method = evidence_config.get('frequency_aggregation')
-        normalization_method = evidence_config.get('normalization_method')
-        if not aggregation_method or not normalization_method:
-             raise ConfigurationError("Missing 'frequency_aggregation' or 'normalization_method' in evidence_strength config.")
+        params = _get_params(config)
+        weights = params.weights
 
         # --- Calculate Raw Score ---
-        raw_score = _calculate_raw_weighted_frequency(mentions, weights, aggregation_method)
+        if features is None:
+            features = MentionFeatures.from_mentions(mentions, weights)
+        raw_score = _calculate_raw_weighted_frequency(features, weights, params.aggregation_method)
 
         # --- Apply Normalization ---
-        normalized_score = _apply_normalization(
-            raw_score,
-            entity_a_prominence,
-            entity_b_prominence,
-            len(mentions), # Pass total mentions count if needed by normalization
-            normalization_method
-        )
+        if params.normalization_method == "None":
+            normalized_score = raw_score # No-op; prominence is unused
+        else:
+            normalized_score = _apply_normalization(
+                raw_score,
+                entity_a_prominence,
+                entity_b_prominence,
+                mention_count, # Pass total mentions count if needed by normalization
+                params.normalization_method
+            )
 
         logger.info(f"Evidence Strength calculation complete. Score: {normalized_score}")
         return normalized_score
@@ -0,0 +1,144 @@
+# src/scoring/fused.py
+# Calculates all ensemble scores (evidence, sentiment, trend) in a single pass over the mentions.
+
+import datetime
+from typing import List, Dict, Any, Optional
+from ..data_models.models import MentionItem
+from ._features import MentionFeatures
+from . import evidence, sentiment, trend, _kernels
+from ..utils.logger import get_logger
+from ..exceptions import CalculationError, ConfigurationError
+
+logger = get_logger()
+
+def calculate_all(mentions: Optional[List[MentionItem]], entity_a_prominence: float, entity_b_prominence: float, config: Dict[str, Any],
+                  features: Optional[MentionFeatures] = None, reference_year: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Calculates the evidence strength, sentiment and trend scores in one pass over the mentions.
+
+    Equivalent to calling `evidence.calculate`, `sentiment.calculate` and `trend.calculate`
+    separately, but accumulates every per-mention statistic in a single loop over the
+    MentionFeatures columns (`_kernels.fused_scores`) instead of traversing them once per
+    score (and once more per trend method). Post-loop steps (normalization, dominant sentiment, progression points)
+    reuse the same helpers as the individual modules.
+
+    Args:
+        mentions: List of MentionItem dicts for the relationship (may be None when `features` is given).
+        entity_a_prominence: Overall prominence score for entity A.
+        entity_b_prominence: Overall prominence score for entity B.
+        config: The loaded configuration dictionary.
+        features: Optional pre-extracted MentionFeatures for the mentions (built from `mentions` here if omitted).
+        reference_year: Year that trend ages and time windows are measured from (defaults to the current year).
+
+    Returns:
+        A dictionary with 'evidence_strength', 'sentiment_scores' and 'trend_scores',
+        shaped like the output of `RelationshipScorer.get_all_scores`.
+
+    Raises:
+        CalculationError: If calculation fails, including invalid evidence settings (as raised by `evidence.calculate`).
+        ConfigurationError: If the sentiment or trend config is invalid or missing required keys.
+    """
+    logger.info("Calculating all scores in a single fused pass...")
+    mention_count = len(features) if features is not None else len(mentions or ())
+    if not mention_count:
+        logger.warning("No mentions provided for fused score calculation. Returning zero scores.")
+        return {
+            "evidence_strength": 0.0,
+            "sentiment_scores": sentiment._build_scores(0.0, 0.0, 0.0),
+            "trend_scores": {
+                "recency_weighted": 0.0,
+                "rate_of_change": 0.0,
+                "evidence_progression": 0.0
+            }
+        }
+
+    try:
+        # --- Get relevant config sections ---
+        # The evidence settings are checked first, as evidence.calculate runs first on the individual path
+        try:
+            evidence_params = evidence._get_params(config)
+            if evidence_params.aggregation_method not in ("SimpleSum", "Logarithmic"):
+                raise ConfigurationError(f"Invalid frequency aggregation method specified: {evidence_params.aggregation_method}")
+            if evidence_params.normalization_method not in evidence._NORMALIZATION_METHODS:
+                raise ConfigurationError(f"Invalid normalization method specified: {evidence_params.normalization_method}")
+        except ConfigurationError as e:
+            raise _evidence_error(e)
+        sentiment._get_params(config)
+        trend_params = trend._get_params(config)
+        weights = evidence_params.weights
+        aggregation_method = evidence_params.aggregation_method
+        decay_rate = trend_params.decay_rate
+        if decay_rate < 0:
+            logger.warning("Decay rate is negative, which is unusual. Ensure this is intended.")
+
+        if features is None:
+            features = MentionFeatures.from_mentions(mentions, weights)
+
+        # --- Determine time boundaries ---
+        current_year = reference_year if reference_year is not None else datetime.datetime.now().year
+        window_bounds = trend._window_bounds(current_year, max(1, int(trend_params.window_years)))
+        recent_start_year = None
+        if trend_params.recent_years_threshold is not None:
+            recent_start_year = current_year - int(trend_params.recent_years_threshold) + 1
+
+        # --- Accumulate all statistics in one pass ---
+        acc = _kernels.fused_scores(
+            features.years, features.source_types, features.sentiments, features.weights,
+            decay_rate, current_year, window_bounds, recent_start_year
+        )
+        for source_type in acc.unconfigured:
+            logger.warning(f"Source type '{source_type}' not found in configured weights. Mention skipped.")
+        for year, age in acc.overflowed:
+            logger.error(f"Decay factor overflows for mention year {year} with age {age} and decay rate {decay_rate}. Skipping mention.")
+        for source_type, year in acc.zero_weight_in_window:
+            logger.warning(f"Mention from source '{source_type}' in year {year} has configured weight of 0.")
+
+        # --- Finalize scores ---
+        try:
+            raw_score = evidence._raw_score_from_aggregates(acc.weighted_sum, acc.mentions_by_type, weights, aggregation_method)
+            if evidence_params.normalization_method == "None":
+                evidence_strength = raw_score
+            else:
+                evidence_strength = evidence._apply_normalization(
+                    raw_score,
+                    entity_a_prominence,
+                    entity_b_prominence,
+                    mention_count,
+                    evidence_params.normalization_method
+                )
+        except (ConfigurationError, KeyError, ValueError, ZeroDivisionError) as e:
+            raise _evidence_error(e)
+
+        if recent_start_year is None:
+            evidence_progression = 0.0
+        else:
+            evidence_progression = trend._score_progression(
+                acc.max_historical_weight, acc.recent_source_types, recent_start_year, trend_params.progression_tiers
+            )
+
+        scores = {
+            "evidence_strength": evidence_strength,
+            "sentiment_scores": sentiment._build_scores(acc.positive_score, acc.negative_score, acc.neutral_score),
+            "trend_scores": {
+                "recency_weighted": acc.recency_score,
+                "rate_of_change": acc.current_window_score - acc.previous_window_score,
+                "evidence_progression": evidence_progression
+            }
+        }
+        logger.info(f"Fused score calculation complete. Evidence: {evidence_strength}")
+        return scores
+
+    except CalculationError:
+        raise # Already logged (evidence errors)
+    except ConfigurationError as e:
+        logger.error(f"Configuration error during fused score calculation: {e}", exc_info=True)
+        raise # Re-raise specific config errors
+    except Exception as e:
+        # Catch unexpected errors
+        logger.error(f"An unexpected error occurred during fused score calculation: {e}", exc_info=True)
+        raise CalculationError(f"Unexpected error in fused score calculation: {e}")
+
+def _evidence_error(error: Exception) -> CalculationError:
+    """ Logs an evidence strength error and wraps it the way `evidence.calculate` does. """
+    logger.error(f"Error during evidence strength calculation: {error}", exc_info=True)
+    return CalculationError(f"Failed to calculate evidence strength: {error}")
@@ -1,14 +1,85 @@
 # src/scoring/sentiment.py
 # Calculates the detailed Sentiment Scores for the relationship.
 
-from typing import List, Dict, Any
-from ..data_models.models import MentionItem, SentimentScoresOutput # Import Pydantic models
+from typing import List, Dict, Any, Optional
+from ..data_models.models import MentionItem # Import Pydantic model
+from ._features import MentionFeatures, POSITIVE, NEGATIVE, NEUTRAL
+from ._params import SentimentParams, cached_params
 from ..utils.logger import get_logger
 from ..exceptions import CalculationError, ConfigurationError
 
 logger = get_logger()
 
-def calculate(mentions: List[MentionItem], config: Dict[str, Any]) -> Dict[str, Any]:
+def _build_scores(positive_score: float, negative_score: float, neutral_score: float) -> Dict[str, Any]:
+    """
+    Derives the net score and dominant sentiment from the per-category weighted sums.
+
+    Args:
+        positive_score: Weighted sum of positive mentions.
+        negative_score: Weighted sum of negative mentions.
+        neutral_score: Weighted sum of neutral mentions.
+
+    Returns:
+        A plain dictionary with the SentimentScoresOutput fields. The Pydantic model stays the
+        schema of record but is not instantiated here; the assembled output is validated
+        against ScorerOutputData only when `validate_output` is enabled.
+    """
+    # --- Calculate Net Score ---
+    net_score = positive_score - negative_score
+
+    # --- Determine Dominant Sentiment ---
+    # A category is dominant only if it strictly outscores both others; ties fall back to Neutral.
+    # More sophisticated logic could use thresholds from config if defined.
+    if positive_score > max(negative_score, neutral_score):
+         dominant_sentiment = "Positive"
+    elif negative_score > max(positive_score, neutral_score):
+         dominant_sentiment = "Negative"
+    else:
+         dominant_sentiment = "Neutral"
+
+    # Override to 'Mixed' when neither positive nor negative strongly dominates the other
+    # (positive share of the non-neutral score between 30% and 70%) and together they outweigh neutral.
+    # This threshold logic can be refined based on requirements.
+    non_neutral_score = positive_score + negative_score
+    if (non_neutral_score > 0 and non_neutral_score > neutral_score # non_neutral_score > 0 avoids division by zero
+            and 0.3 < positive_score / non_neutral_score < 0.7):
+         dominant_sentiment = "Mixed"
+
+    # --- Prepare Output ---
+    return {
+        "positive_score": positive_score,
+        "negative_score": negative_score,
+        "neutral_score": neutral_score,
+        "net_score": net_score,
+        "dominant_sentiment": dominant_sentiment
+    }
+
+def _parse_params(config: Dict[str, Any]) -> SentimentParams:
+    """
+    Extracts the source weights used for sentiment scoring, warning on unsupported aggregation methods.
+
+    Use `_get_params` instead, which parses each config only once.
+
+    Raises:
+        ConfigurationError: If 'source_weights' is missing.
+    """
+    weights = config.get('source_weights')
+    sentiment_config = config.get('sentiment', {})
+    aggregation_method = sentiment_config.get('aggregation_method', 'NetScoreDetailed') # Default if not specified
+
+    if not weights:
+        raise ConfigurationError("Missing 'source_weights' in configuration.")
+    # Ensure the configured method is the one we are implementing here
+    if aggregation_method != "NetScoreDetailed":
+         logger.warning(f"Sentiment aggregation method '{aggregation_method}' configured, but only 'NetScoreDetailed' is implemented in this function. Proceeding with NetScoreDetailed.")
+         # Or raise ConfigurationError? For now, proceed with warning.
+    return SentimentParams(weights)
+
+def _get_params(config: Dict[str, Any]) -> SentimentParams:
+    """ Returns the parsed sentiment settings for `config` (cached per config object). """
+    return cached_params(config, _parse_params)
+
+def calculate(mentions: Optional[List[MentionItem]], config: Dict[str, Any], features: Optional[MentionFeatures] = None) -> Dict[str, Any]:
     """
     Calculates detailed sentiment scores based on mentions and source weights.
 
@@ -17,8 +88,9 @@ def calculate(mentions: List[MentionItem], config: Dict[str, Any]) -> Dict[str,
     dominant sentiment category.
 
     Args:
-        mentions: List of MentionItem objects for the relationship.
+        mentions: List of MentionItem dicts for the relationship (may be None when `features` is given).
         config: The loaded configuration dictionary.
+        features: Optional pre-extracted MentionFeatures for the mentions (built from `mentions` here if omitted).
 
     Returns:
         A dictionary containing the calculated sentiment scores, conforming
@@ -29,98 +101,53 @@ def calculate(mentions: List[MentionItem], config: Dict[str, Any]) -> Dict[str,
         ConfigurationError: If config is invalid or missing required keys.
     """
     logger.info("Calculating Sentiment scores...")
-    if not mentions:
+    mention_count = len(features) if features is not None else len(mentions or ())
+    if not mention_count:
         logger.warning("No mentions provided for sentiment calculation. Returning zero scores.")
         # Return default structure expected by SentimentScoresOutput
-        return SentimentScoresOutput(
-            positive_score=0.0,
-            negative_score=0.0,
-            neutral_score=0.0,
-            net_score=0.0,
-            dominant_sentiment="Neutral" # Or perhaps "Mixed"? Defaulting to Neutral.
-        ).model_dump() # Return as dict
+        return {
+            "positive_score": 0.0,
+            "negative_score": 0.0,
+            "neutral_score": 0.0,
+            "net_score": 0.0,
+            "dominant_sentiment": "Neutral" # Or perhaps "Mixed"? Defaulting to Neutral.
+        }
 
     try:
         # --- Get relevant config sections ---
-        weights = config.get('source_weights')
-        sentiment_config = config.get('sentiment', {})
-        aggregation_method = sentiment_config.get('aggregation_method', 'NetScoreDetailed') # Default if not specified
-
-        if not weights:
-            raise ConfigurationError("Missing 'source_weights' in configuration.")
-        # Ensure the configured method is the one we are implementing here
-        if aggregation_method != "NetScoreDetailed":
-             logger.warning(f"Sentiment aggregation method '{aggregation_method}' configured, but only 'NetScoreDetailed' is implemented in this function. Proceeding with NetScoreDetailed.")
-             # Or raise ConfigurationError? For now, proceed with warning.
+        weights = _get_params(config).weights
 
         # --- Calculate weighted sums for each sentiment category ---
         positive_score = 0.0
         negative_score = 0.0
         neutral_score = 0.0
 
-        for mention in mentions:
-            try:
-                weight = weights[mention.source_type]
-            except KeyError:
-                logger.warning(f"Source type '{mention.source_type}' not found in configured weights for sentiment calculation. Mention skipped.")
-                continue # Skip mentions with unconfigured source types
-
-            if mention.sentiment == "Positive":
+        if features is None:
+            features = MentionFeatures.from_mentions(mentions, weights)
+
+        # Skip mentions with unconfigured source types (weight None); warn once per call
+        skipped = features.weights.count(None)
+        if skipped:
+            skipped_types = sorted({source_type for source_type, weight in zip(features.source_types, features.weights) if weight is None})
+            logger.warning(f"{skipped} mention(s) with source types not found in configured weights skipped for sentiment calculation: {skipped_types}")
+            coded_weights = [(code, weight) for code, weight in zip(features.sentiments, features.weights) if weight is not None]
+        else:
+            coded_weights = zip(features.sentiments, features.weights)
+
+        # Single pass over the integer-coded sentiment column
+        for sentiment_code, weight in coded_weights:
+            if sentiment_code == POSITIVE:
                 positive_score += weight
-            elif mention.sentiment == "Negative":
+            elif sentiment_code == NEGATIVE:
                 negative_score += weight
-            elif mention.sentiment == "Neutral":
+            elif sentiment_code == NEUTRAL:
                 neutral_score += weight
-            # else: # Should not happen if input validation is working
-            #     logger.warning(f"Unknown sentiment '{mention.sentiment}' found for mention '{mention.mention_id}'. Skipping.")
-
-        # --- Calculate Net Score ---
-        net_score = positive_score - negative_score
-
-        # --- Determine Dominant Sentiment ---
-        # Simple logic: Compare positive and negative scores. If close, consider neutral count or declare Mixed.
-        # More sophisticated logic could use thresholds from config if defined.
-        dominant_sentiment = "Neutral" # Default
-        if positive_score > negative_score and positive_score > neutral_score:
-             dominant_sentiment = "Positive"
-        elif negative_score > positive_score and negative_score > neutral_score:
-             dominant_sentiment = "Negative"
-        elif neutral_score >= positive_score and neutral_score >= negative_score:
-             # If neutral is highest or equal to highest, call it Neutral (unless pos/neg are both significant?)
-             dominant_sentiment = "Neutral"
-
-        # Check for 'Mixed' cases - e.g., if positive and negative are both significant and outweigh neutral
-        # This threshold logic can be refined based on requirements.
-        total_score = positive_score + negative_score + neutral_score
-        if total_score > 0: # Avoid division by zero
-             # Example threshold: if both positive and negative contribute > 25% of non-neutral score
-             non_neutral_score = positive_score + negative_score
-             if non_neutral_score > 0:
-                  pos_ratio = positive_score / non_neutral_score
-                  neg_ratio = negative_score / non_neutral_score
-                  # If neither strongly dominates the other (e.g., both between 30% and 70%)
-                  if 0.3 < pos_ratio < 0.7:
-                       # And if the combined non-neutral score is significant compared to neutral
-                       if non_neutral_score > neutral_score: # Example condition
-                            dominant_sentiment = "Mixed"
-
-        # If all scores are zero (e.g., only mentions with unknown source types)
-        if positive_score == 0 and negative_score == 0 and neutral_score == 0:
-             dominant_sentiment = "Neutral" # Or "Mixed"? Consistent default needed.
-
-
-        # --- Prepare Output ---
-        result = SentimentScoresOutput(
-            positive_score=positive_score,
-            negative_score=negative_score,
-            neutral_score=neutral_score,
-            net_score=net_score,
-            dominant_sentiment=dominant_sentiment
-        )
-
-        logger.info(f"Sentiment score calculation complete. Dominant: {dominant_sentiment}, Net: {net_score:.2f}")
-        # Return as dictionary to match expected output format of main scorer
-        return result.model_dump()
+            # else: # UNKNOWN_SENTIMENT - should not happen if input validation is working
+
+        result = _build_scores(positive_score, negative_score, neutral_score)
+
+        logger.info(f"Sentiment score calculation complete. Dominant: {result['dominant_sentiment']}, Net: {result['net_score']:.2f}")
+        return result
 
     except ConfigurationError as e:
         logger.error(f"Configuration error during sentiment calculation: {e}", exc_info=True)
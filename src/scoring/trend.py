@@ -1,83 +1,92 @@
 # src/scoring/trend.py
 # Calculates the Trend Score for the relationship.
 
-import math
 import datetime
-from typing import List, Dict, Any, Optional
+import logging
+from collections.abc import Mapping
+from typing import List, Dict, Any, Optional, Set, Tuple
 from ..data_models.models import MentionItem # Import Pydantic model
+from ._features import MentionFeatures
+from ._params import TrendParams, cached_params
+from . import _kernels
 from ..utils.logger import get_logger
 from ..exceptions import CalculationError, ConfigurationError
-from datetime import timedelta
 
 logger = get_logger()
 
-def _calculate_recency_weighted_score(mentions: List[MentionItem], weights: Dict[str, float], decay_rate: float) -> float:
+def _calculate_recency_weighted_score(features: MentionFeatures, decay_rate: float, *, reference_year: int) -> float:
     """
     Calculates trend score based on recency, weighting recent mentions more heavily
-    using exponential decay.
+    using exponential decay. Ages are measured from `reference_year`.
     """
-    logger.debug(f"RecencyWeighted: Calculating trend score using RecencyWeighted method with decay rate: {decay_rate}")
-    trend_score = 0.0
-    current_year = datetime.datetime.now().year
+    logger.debug("RecencyWeighted: Calculating trend score using RecencyWeighted method with decay rate: %s", decay_rate)
+    current_year = reference_year
 
     if decay_rate < 0:
         logger.warning("Decay rate is negative, which is unusual. Ensure this is intended.")
 
-    for mention in mentions:
-        try:
-            weight = weights[mention.source_type]
-        except KeyError:
-            logger.warning(f"Source type '{mention.source_type}' not found in configured weights for trend calculation. Mention skipped.")
-            continue
-
-        # Calculate age (ensure it's non-negative)
-        age = max(0, current_year - mention.year)
-
-        # Apply exponential decay: score = weight * exp(-lambda * age)
-        try:
-             decay_factor = math.exp(-decay_rate * age)
-             trend_score += weight * decay_factor
-        except OverflowError:
-             logger.error(f"OverflowError calculating decay factor for mention year {mention.year} with age {age} and decay rate {decay_rate}. Skipping mention.")
-             continue # Skip this mention if calculation overflows
-
-    logger.debug(f"RecencyWeighted: Calculated recency-weighted trend score: {trend_score}")
+    # Gather the configured mentions' weights and years as parallel columns (usually all mentions are configured)
+    weights = features.weights
+    years = features.years
+    if None in weights:
+        for source_type, weight in zip(features.source_types, weights):
+            if weight is None:
+                logger.warning(f"Source type '{source_type}' not found in configured weights for trend calculation. Mention skipped.")
+        configured = [(year, weight) for year, weight in zip(years, weights) if weight is not None]
+        years = [year for year, _ in configured]
+        weights = [weight for _, weight in configured]
+
+    # Ages are clamped at 0 so future-dated mentions are not boosted
+    ages = [current_year - year if year < current_year else 0 for year in years]
+
+    if decay_rate < 0:
+        # Decay factors can only overflow with a negative decay rate: skip those mentions up front
+        neg_decay = -decay_rate
+        max_exponent = _kernels.MAX_DECAY_EXPONENT
+        if any(neg_decay * age > max_exponent for age in ages):
+            for age in ages:
+                if neg_decay * age > max_exponent:
+                    logger.error(f"Decay factor overflows for mention with age {age} and decay rate {decay_rate}. Skipping mention.")
+            kept = [(weight, age) for weight, age in zip(weights, ages) if not neg_decay * age > max_exponent]
+            weights = [weight for weight, _ in kept]
+            ages = [age for _, age in kept]
+
+    # Apply exponential decay: score = weight * exp(-lambda * age)
+    trend_score = _kernels.recency_sum(weights, ages, decay_rate)
+
+    logger.debug("RecencyWeighted: Calculated recency-weighted trend score: %s", trend_score)
     return trend_score
 
-def _calculate_weighted_score_for_mentions(mentions: List[MentionItem], weights: Dict[str, float]) -> float:
-    """Calculates the sum of weighted scores for a list of mentions,
-    where the score for each mention is determined by its source_type weight from the config.
+def _window_bounds(current_year: int, window_size_years: int) -> Tuple[int, int, int, int]:
     """
-    total_score = 0.0
-    for mention in mentions:
-        # Get weight based on source_type from the provided weights dictionary
-        weight = weights.get(mention.source_type, 0.0) # Use 0 weight if source_type not in weights
-        if weight == 0.0 and mention.source_type in weights:
-             # Only warn if the source_type was explicitly configured but set to 0
-             logger.warning(f"Mention from source '{mention.source_type}' in year {mention.year} has configured weight of 0.")
-        elif mention.source_type not in weights:
-             logger.warning(f"Mention source '{mention.source_type}' in year {mention.year} not found in source_weights config. Assigning weight 0.")
-
-        # The score contribution of this mention is its configured weight
-        total_score += weight
-    return total_score
-
-def _calculate_rate_of_change_score(mentions: List[MentionItem], weights: Dict[str, float], window_years: float) -> float:
+    Defines the year boundaries for the rate-of-change windows.
+
+    Current window: (current_year - window_size_years, current_year]
+    Previous window: (current_year - 2*window_size_years, current_year - window_size_years]
+
+    Returns:
+        Tuple of (current start (exclusive), current end, previous start (exclusive), previous end).
+    """
+    current_window_start_year_exclusive = current_year - window_size_years
+    return (current_window_start_year_exclusive, current_year,
+            current_year - (2 * window_size_years), current_window_start_year_exclusive)
+
+def _calculate_rate_of_change_score(features: MentionFeatures, window_years: float, *, reference_year: int) -> float:
     """
     Calculates trend score based on the change in weighted evidence strength
     between two consecutive time windows defined by years.
 
     Args:
-        mentions: A list of MentionItem objects, each with a 'year' (int) and 'score' (float).
-        weights: A dictionary mapping source_type to its weight.
+        features: MentionFeatures for the relationship (uses 'years', 'source_types' and 'weights').
         window_years: The duration of each time window in years (float, will be converted to int >= 1).
+        reference_year: The year the current window ends in (inclusive).
 
     Returns:
         The difference between the weighted score in the most recent window
         and the weighted score in the preceding window. Returns 0.0 if there are
         no mentions or if window_years is non-positive.
     """
-    if not mentions:
+    if not features:
         logger.warning("No mentions provided for RateOfChange trend calculation. Returning 0.")
         return 0.0
 
@@ -87,51 +96,77 @@ def _calculate_rate_of_change_score(mentions: List[MentionItem], weights: Dict[s
          logger.warning(f"window_years ({window_years}) is non-positive. RateOfChange calculation requires positive window size. Returning 0.")
          return 0.0
 
-    current_year = datetime.datetime.now().year
-
-    # Define year boundaries for the windows
-    # Current window: (current_year - window_size_years, current_year]
-    # Previous window: (current_year - 2*window_size_years, current_year - window_size_years]
-    current_window_end_year = current_year
-    current_window_start_year_exclusive = current_year - window_size_years
-    previous_window_end_year = current_window_start_year_exclusive
-    previous_window_start_year_exclusive = current_year - (2 * window_size_years)
-
-    logger.debug(f"RateOfChange: Current Year={current_year}, Window Size={window_size_years} years")
-    logger.debug(f"RateOfChange: Current Window Year Range: ({current_window_start_year_exclusive}, {current_window_end_year}]")
-    logger.debug(f"RateOfChange: Previous Window Year Range: ({previous_window_start_year_exclusive}, {previous_window_end_year}]")
-
-    # Filter mentions into windows based on year
-    current_window_mentions = []
-    previous_window_mentions = []
-
-    for mention in mentions:
-        # Validate mention year
-        if not isinstance(mention.year, int) or mention.year <= 0:
-            logger.warning(f"Mention has invalid year '{mention.year}'. Skipping.")
-            continue
-
-        mention_year = mention.year
-        # Check if the mention falls within the defined year windows
-        if current_window_start_year_exclusive < mention_year <= current_window_end_year:
-            current_window_mentions.append(mention)
-        elif previous_window_start_year_exclusive < mention_year <= previous_window_end_year:
-            previous_window_mentions.append(mention)
-
-    # Calculate weighted scores for each window
-    current_window_score = _calculate_weighted_score_for_mentions(current_window_mentions, weights)
-    previous_window_score = _calculate_weighted_score_for_mentions(previous_window_mentions, weights)
+    current_year = reference_year
+    (current_window_start_year_exclusive, current_window_end_year,
+     previous_window_start_year_exclusive, previous_window_end_year) = _window_bounds(current_year, window_size_years)
+
+    debug_enabled = logger.isEnabledFor(logging.DEBUG) # Skip formatting the diagnostics below when DEBUG is off
+    if debug_enabled:
+        logger.debug(f"RateOfChange: Current Year={current_year}, Window Size={window_size_years} years")
+        logger.debug(f"RateOfChange: Current Window Year Range: ({current_window_start_year_exclusive}, {current_window_end_year}]")
+        logger.debug(f"RateOfChange: Previous Window Year Range: ({previous_window_start_year_exclusive}, {previous_window_end_year}]")
+
+    # Sum the weights of the mentions in each window in one pass (the two windows are contiguous)
+    current_window_score = previous_window_score = 0.0
+    current_window_count = previous_window_count = 0
+
+    # Skip the scan entirely when every mention predates both windows (long-tail historical relationships)
+    if max(features.years) > previous_window_start_year_exclusive:
+        # Mention years are validated as ints in (1900, 2100) by MentionItem, so they need no per-mention check here
+        for mention_year, source_type, weight in zip(features.years, features.source_types, features.weights):
+            # Check if the mention falls within the defined year windows
+            if not previous_window_start_year_exclusive < mention_year <= current_window_end_year:
+                continue
+
+            if weight is None:
+                 logger.warning(f"Mention source '{source_type}' in year {mention_year} not found in source_weights config. Assigning weight 0.")
+                 weight = 0.0 # Use 0 weight if source_type not in weights
+            elif weight == 0.0:
+                 # Only warn if the source_type was explicitly configured but set to 0
+                 logger.warning(f"Mention from source '{source_type}' in year {mention_year} has configured weight of 0.")
+
+            # The score contribution of each mention is its configured weight
+            if mention_year > current_window_start_year_exclusive:
+                current_window_score += weight
+                current_window_count += 1
+            else:
+                previous_window_score += weight
+                previous_window_count += 1
 
     # Calculate the rate of change (difference)
     trend_score = current_window_score - previous_window_score
 
-    logger.debug(f"RateOfChange Trend: Current Window ({current_window_start_year_exclusive+1}-{current_window_end_year}): Score={current_window_score:.2f} ({len(current_window_mentions)} mentions)")
-    logger.debug(f"RateOfChange Trend: Previous Window ({previous_window_start_year_exclusive+1}-{previous_window_end_year}): Score={previous_window_score:.2f} ({len(previous_window_mentions)} mentions)")
-    logger.debug(f"RateOfChange Trend: Calculated Score = {trend_score:.2f}")
+    if debug_enabled:
+        logger.debug(f"RateOfChange Trend: Current Window ({current_window_start_year_exclusive+1}-{current_window_end_year}): Score={current_window_score:.2f} ({current_window_count} mentions)")
+        logger.debug(f"RateOfChange Trend: Previous Window ({previous_window_start_year_exclusive+1}-{previous_window_end_year}): Score={previous_window_score:.2f} ({previous_window_count} mentions)")
+        logger.debug(f"RateOfChange Trend: Calculated Score = {trend_score:.2f}")
 
     return trend_score
 
-def _calculate_evidence_progression_score(mentions: List[MentionItem], weights: Dict[str, float], config: Dict[str, Any]) -> float:
+def _parse_progression_config(config: Dict[str, Any]) -> Optional[Tuple[float, Dict[str, Any]]]:
+    """
+    Extracts 'recent_years_threshold' and 'progression_points' from the evidence_progression config.
+
+    Returns:
+        Tuple of (recent_years_threshold, progression_points), or None (after logging) if either is invalid.
+    """
+    try:
+        recent_years_threshold = config.get('recent_years_threshold')
+        progression_points = config.get('progression_points')
+
+        if recent_years_threshold is None or not isinstance(recent_years_threshold, (int, float)) or recent_years_threshold <= 0:
+             logger.error(f"Invalid or missing 'recent_years_threshold' ({recent_years_threshold}) in evidence_progression config.")
+             return None # Cannot proceed without a valid threshold
+        if progression_points is None or not isinstance(progression_points, Mapping):
+             logger.error(f"Invalid or missing 'progression_points' in evidence_progression config.")
+             return None # Cannot proceed without points mapping
+
+    except Exception as e:
+         logger.error(f"Error accessing evidence_progression config: {e}", exc_info=True)
+         return None
+    return recent_years_threshold, progression_points
+
+def _calculate_evidence_progression_score(features: MentionFeatures, params: TrendParams, *, reference_year: int) -> float:
     """
     Calculates trend score based on recent progression up the evidence hierarchy.
 
@@ -139,97 +174,145 @@ def _calculate_evidence_progression_score(mentions: List[MentionItem], weights:
     time window compared to the maximum weight seen before that window.
 
     Args:
-        mentions: List of MentionItem objects (each with 'year' and 'source_type').
-        weights: Dictionary mapping source_type to its numerical weight.
-        config: The 'evidence_progression' sub-dictionary from the main config,
-                containing 'recent_years_threshold' and 'progression_points'.
+        features: MentionFeatures for the relationship (uses 'years', 'source_types' and 'weights').
+        params: Parsed trend settings (uses 'weights', 'recent_years_threshold' and 'progression_points').
+        reference_year: The last year of the recent period.
 
     Returns:
         The calculated progression score (float). Returns 0.0 if config is
         missing, invalid, or no progression is detected.
     """
-    if not mentions:
+    if not features:
         logger.warning("No mentions provided for EvidenceProgression calculation. Returning 0.")
         return 0.0
 
     # --- Get config parameters ---
-    try:
-        recent_years_threshold = config.get('recent_years_threshold')
-        progression_points = config.get('progression_points')
-
-        if recent_years_threshold is None or not isinstance(recent_years_threshold, (int, float)) or recent_years_threshold <= 0:
-             logger.error(f"Invalid or missing 'recent_years_threshold' ({recent_years_threshold}) in evidence_progression config.")
-             return 0.0 # Cannot proceed without a valid threshold
-        if progression_points is None or not isinstance(progression_points, dict):
-             logger.error(f"Invalid or missing 'progression_points' in evidence_progression config.")
-             return 0.0 # Cannot proceed without points mapping
-
-    except Exception as e:
-         logger.error(f"Error accessing evidence_progression config: {e}", exc_info=True)
-         return 0.0
+    recent_years_threshold = params.recent_years_threshold
+    if recent_years_threshold is None:
+        return 0.0 # Invalid evidence_progression config (logged when parsed)
 
     # --- Determine time boundaries ---
-    current_year = datetime.datetime.now().year
+    current_year = reference_year
     # Year from which the 'recent' period starts (inclusive)
     recent_start_year = current_year - int(recent_years_threshold) + 1
-    logger.debug(f"EvidenceProgression: Current Year={current_year}, Recent Threshold={recent_years_threshold} years -> Recent Start Year={recent_start_year}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"EvidenceProgression: Current Year={current_year}, Recent Threshold={recent_years_threshold} years -> Recent Start Year={recent_start_year}")
 
     # --- Find max historical weight and recent source types ---
     max_historical_weight = -1.0 # Initialize below any possible weight
     recent_source_types = set()
 
-    for mention in mentions:
-        if not isinstance(mention.year, int) or mention.year <= 0:
-            # Skip mentions with invalid years
-            continue
+    for year, source_type, weight in zip(features.years, features.source_types, features.weights):
+        mention_weight = -1.0 if weight is None else weight # Use -1 to handle unweighted types gracefully
 
-        mention_weight = weights.get(mention.source_type, -1.0) # Use -1 to handle unweighted types gracefully
-
-        if mention.year < recent_start_year:
+        if year < recent_start_year:
             # Mention is in the historical period
             if mention_weight > max_historical_weight:
                 max_historical_weight = mention_weight
         else:
             # Mention is in the recent period
             if mention_weight > 0: # Only consider source types with positive weight
-                 recent_source_types.add(mention.source_type)
+                 recent_source_types.add(source_type)
+
+    return _score_progression(max_historical_weight, recent_source_types, recent_start_year, params.progression_tiers)
+
+def _score_progression(max_historical_weight: float, recent_source_types: Set[str], recent_start_year: int,
+                       progression_tiers: Dict[str, Tuple[float, Optional[float]]]) -> float:
+    """
+    Awards progression points for recent source types whose weight exceeds the historical maximum.
+
+    Args:
+        max_historical_weight: Highest source weight seen before the recent period (-1.0 if none).
+        recent_source_types: Positively weighted source types seen in the recent period.
+        recent_start_year: First year (inclusive) of the recent period.
+        progression_tiers: Mapping of source_type to its (weight, points) pair, as parsed into TrendParams.
 
+    Returns:
+        The calculated progression score (float).
+    """
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
     if max_historical_weight == -1.0:
         # No valid mentions found in the historical period, treat baseline as 0
         max_historical_weight = 0.0
         logger.debug("EvidenceProgression: No mentions found before recent period. Historical max weight set to 0.")
-    else:
+    elif debug_enabled:
         logger.debug(f"EvidenceProgression: Max weight before {recent_start_year} = {max_historical_weight:.2f}")
 
     # --- Calculate progression score ---
     total_progression_score = 0.0
-    progressed_tiers = []
+    progressed = False
 
     for source_type in recent_source_types:
-        recent_weight = weights.get(source_type, -1.0)
+        recent_weight, points = progression_tiers.get(source_type, (-1.0, None))
         if recent_weight > max_historical_weight:
             # This source type represents a progression beyond the historical max
-            points = progression_points.get(source_type)
-            if points is not None and isinstance(points, (int, float)):
+            if points is not None:
                 total_progression_score += points
-                progressed_tiers.append(f"{source_type} (Weight: {recent_weight:.2f}, Points: {points})")
-                logger.debug(f"  - Progression detected: Reached '{source_type}' (Weight: {recent_weight:.2f} > {max_historical_weight:.2f}). Added {points} points.")
+                progressed = True
+                if debug_enabled:
+                    logger.debug(f"  - Progression detected: Reached '{source_type}' (Weight: {recent_weight:.2f} > {max_historical_weight:.2f}). Added {points} points.")
             else:
                  logger.warning(f"  - Progression detected for '{source_type}' (Weight: {recent_weight:.2f}), but no valid points found in progression_points config. Skipping.")
 
-    if not progressed_tiers:
+    if not progressed:
         logger.debug("EvidenceProgression: No progression detected in the recent period.")
 
     logger.info(f"EvidenceProgression calculation complete. Score: {total_progression_score:.2f}")
     return total_progression_score
 
-def calculate(mentions: List[MentionItem], config: Dict[str, Any]) -> Dict[str, float]:
+def _parse_params(config: Dict[str, Any]) -> TrendParams:
+    """
+    Extracts the trend settings from the configuration, applying defaults where values are missing.
+
+    Use `_get_params` instead, which parses each config only once.
+
+    Raises:
+        ConfigurationError: If 'trend' or 'source_weights' is missing.
+    """
+    trend_config = config.get('trend', {})
+    weights = config.get('source_weights', {})
+    if not trend_config or not weights:
+         raise ConfigurationError("Missing 'trend' or 'source_weights' in configuration.")
+
+    recency_config = trend_config.get('recency_weighted', {})
+    decay_rate = recency_config.get('decay_rate')
+    if decay_rate is None:
+         logger.warning("Missing 'decay_rate' in trend.recency_weighted config. Using default 0.15.")
+         decay_rate = 0.15
+
+    roc_config = trend_config.get('rate_of_change', {})
+    window_years = roc_config.get('window_years')
+    if window_years is None or window_years <= 0:
+         logger.warning("Missing or invalid 'window_years' in trend.rate_of_change config. Using default 5.0.")
+         window_years = 5.0
+
+    progression = _parse_progression_config(trend_config.get('evidence_progression', {}))
+    recent_years_threshold, progression_points = progression if progression is not None else (None, None)
+
+    # Pair each source type's weight with its progression points once, instead of per scored relationship
+    progression_tiers = None
+    if progression_points is not None:
+        progression_tiers = {}
+        for source_type, weight in weights.items():
+            points = progression_points.get(source_type)
+            progression_tiers[source_type] = (weight, points if isinstance(points, (int, float)) else None)
+
+    return TrendParams(weights, decay_rate, window_years, recent_years_threshold, progression_points, progression_tiers)
+
+def _get_params(config: Dict[str, Any]) -> TrendParams:
+    """ Returns the parsed trend settings for `config` (cached per config object). """
+    return cached_params(config, _parse_params)
+
+def calculate(mentions: Optional[List[MentionItem]], config: Dict[str, Any], features: Optional[MentionFeatures] = None,
+              reference_year: Optional[int] = None) -> Dict[str, float]:
     """
     Calculates all Trend scores for the relationship using different methods.
 
     Args:
-        mentions: List of MentionItem objects for the relationship.
+        mentions: List of MentionItem dicts for the relationship (may be None when `features` is given).
         config: The loaded configuration dictionary.
+        features: Optional pre-extracted MentionFeatures for the mentions (built from `mentions` here if omitted).
+        reference_year: Year that ages and time windows are measured from (defaults to the current year).
 
     Returns:
         A dictionary containing all trend scores:
@@ -244,7 +327,8 @@ def calculate(mentions: List[MentionItem], config: Dict[str, Any]) -> Dict[str,
         ConfigurationError: If config is invalid or missing required keys.
     """
     logger.info("Calculating all Trend scores...")
-    if not mentions:
+    mention_count = len(features) if features is not None else len(mentions or ())
+    if not mention_count:
         logger.warning("No mentions provided for trend calculation. Returning all scores as 0.")
         return {
             "recency_weighted": 0.0,
@@ -254,33 +338,24 @@ def calculate(mentions: List[MentionItem], config: Dict[str, Any]) -> Dict[str,
 
     try:
         # --- Get relevant config sections ---
-        trend_config = config.get('trend', {})
-        weights = config.get('source_weights', {})
-        if not trend_config or not weights:
-             raise ConfigurationError("Missing 'trend' or 'source_weights' in configuration.")
+        params = _get_params(config)
+
+        if features is None:
+            features = MentionFeatures.from_mentions(mentions, params.weights)
+        if reference_year is None:
+            reference_year = datetime.datetime.now().year
 
         # --- Calculate all trend scores ---
         trend_scores = {}
 
         # 1. Recency Weighted Score
-        recency_config = trend_config.get('recency_weighted', {})
-        decay_rate = recency_config.get('decay_rate')
-        if decay_rate is None:
-             logger.warning("Missing 'decay_rate' in trend.recency_weighted config. Using default 0.15.")
-             decay_rate = 0.15
-        trend_scores['recency_weighted'] = _calculate_recency_weighted_score(mentions, weights, decay_rate)
+        trend_scores['recency_weighted'] = _calculate_recency_weighted_score(features, params.decay_rate, reference_year=reference_year)
 
         # 2. Rate of Change Score
-        roc_config = trend_config.get('rate_of_change', {})
-        window_years = roc_config.get('window_years')
-        if window_years is None or window_years <= 0:
-             logger.warning("Missing or invalid 'window_years' in trend.rate_of_change config. Using default 5.0.")
-             window_years = 5.0
-        trend_scores['rate_of_change'] = _calculate_rate_of_change_score(mentions, weights, window_years)
+        trend_scores['rate_of_change'] = _calculate_rate_of_change_score(features, params.window_years, reference_year=reference_year)
 
         # 3. Evidence Progression Score
-        prog_config = trend_config.get('evidence_progression', {})
-        trend_scores['evidence_progression'] = _calculate_evidence_progression_score(mentions, weights, prog_config)
+        trend_scores['evidence_progression'] = _calculate_evidence_progression_score(features, params, reference_year=reference_year)
 
         logger.info(f"All trend scores calculated: {trend_scores}")
         return trend_scores
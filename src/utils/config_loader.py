@@ -1,24 +1,58 @@
 # src/utils/config_loader.py
 # Utility function to load configuration from the YAML file.
 
+import logging
+import threading
 import yaml
 import os
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any, Dict, Optional
 from ..exceptions import ConfigurationError # Use custom exception
 
+# Use the libyaml-backed loader when PyYAML was built with it (same safe subset, much faster parse)
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# The package logger, looked up once by name: get_logger() can't be used here because
+# utils.logger imports this module to read the logging settings (a circular import).
+# It's configured (handlers, level) as soon as get_logger() is first called.
+logger = logging.getLogger("RelationshipScorerPackage")
+
 # Define the expected path to the config file relative to this file's location
 # Go up two levels (from utils -> src -> root) then into config/
 _CONFIG_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'config'))
 _DEFAULT_CONFIG_PATH = os.path.join(_CONFIG_DIR, 'scoring_config.yaml')
 
 # --- Cached Configuration ---
-# Cache the loaded configuration to avoid repeated file reads
-_cached_config = None
-
-def load_config(config_path: str = None) -> dict:
+# The parsed configuration is memoized to avoid repeated file reads and YAML parsing.
+# Call load_config.cache_clear() to force a reload (e.g., after editing the file).
+# The cached config is shared by every caller, so it is frozen (read-only mappings/tuples).
+# Frozen configs keyed by config_path argument; a handful of paths covers every caller (as in scoring._params)
+_CACHE_SIZE = 8
+_cached_configs: Dict[Optional[str], Mapping] = {}
+_cache_lock = threading.Lock()
+
+def _freeze(value: Any) -> Any:
+    """ Recursively converts dicts to read-only MappingProxyType views and lists to tuples. """
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+def load_config(config_path: str = None) -> Mapping:
     """
     Loads the scoring configuration from a YAML file.
 
-    Uses a cached version after the first load unless a specific path is provided.
+    The result is cached per `config_path` after the first successful load (up to 8 paths); use
+    `load_config.cache_clear()` to force the file to be read again. Loading is thread-safe:
+    concurrent first calls parse the file once.
+
+    The returned configuration is read-only (nested MappingProxyType views, lists as tuples),
+    since the same object is shared by all callers; copy it (e.g., into dicts) to modify it.
 
     Args:
         config_path (str, optional): Absolute path to the configuration file.
@@ -26,46 +60,61 @@ def load_config(config_path: str = None) -> dict:
                                      Defaults to None.
 
     Returns:
-        dict: The loaded configuration dictionary.
+        Mapping: The loaded (read-only) configuration.
 
     Raises:
         ConfigurationError: If the config file cannot be found or parsed.
     """
-    global _cached_config
+    cached = _cached_configs.get(config_path) # Fast path: no lock once the config is loaded
+    if cached is not None:
+        return cached
+
+    with _cache_lock:
+        # Re-check under the lock so concurrent first calls read and parse the file only once
+        cached = _cached_configs.get(config_path)
+        if cached is not None:
+            return cached
+        config = _freeze(_read_config(config_path))
+        if len(_cached_configs) >= _CACHE_SIZE:
+            _cached_configs.pop(next(iter(_cached_configs))) # Evict the oldest entry
+        _cached_configs[config_path] = config
+        return config
+
+def _clear_config_cache() -> None:
+    """ Drops the cached configurations so the next `load_config` call reads the file again. """
+    with _cache_lock:
+        _cached_configs.clear()
+
+load_config.cache_clear = _clear_config_cache
+
+def _read_config(config_path: Optional[str]) -> dict:
+    """
+    Reads and parses the YAML configuration file (uncached; see `load_config`).
 
+    Raises:
+        ConfigurationError: If the config file cannot be found or parsed.
+    """
     # Use default path if none provided
     path_to_load = config_path if config_path else _DEFAULT_CONFIG_PATH
 
-    # If a specific path is given, don't use cache for that call
-    # If default path is used and cache exists, return cache
-    if config_path is None and _cached_config is not None:
-        return _cached_config
-
     # --- File Loading ---
     try:
-        # Check if the determined path exists
-        if not os.path.exists(path_to_load):
-             # Try to provide a helpful error message about where it looked
-             cwd = os.getcwd()
-             raise ConfigurationError(f"Configuration file not found at '{path_to_load}'. Current working directory: '{cwd}'. Ensure the config file exists relative to the package structure or provide an absolute path.")
-
-        # Open and parse the YAML file
+        # Open and parse the YAML file (a missing file surfaces as FileNotFoundError below)
         with open(path_to_load, 'r') as stream:
-            config_data = yaml.safe_load(stream)
+            config_data = yaml.load(stream, Loader=_YamlLoader) # Equivalent to yaml.safe_load
             if not isinstance(config_data, dict):
                  raise ConfigurationError(f"Configuration file '{path_to_load}' does not contain a valid YAML dictionary.")
 
-            # --- Cache the result if default path was used ---
-            if config_path is None:
-                 _cached_config = config_data
-
             return config_data
 
     except yaml.YAMLError as e:
         raise ConfigurationError(f"Error parsing configuration file '{path_to_load}': {e}")
     except FileNotFoundError:
-        # This might be redundant due to the os.path.exists check, but good practice
-         raise ConfigurationError(f"Configuration file not found at '{path_to_load}'.")
+        # Try to provide a helpful error message about where it looked
+        cwd = os.getcwd()
+        raise ConfigurationError(f"Configuration file not found at '{path_to_load}'. Current working directory: '{cwd}'. Ensure the config file exists relative to the package structure or provide an absolute path.")
+    except ConfigurationError:
+        raise # Already descriptive (e.g., not a YAML dictionary)
     except Exception as e:
         # Catch other potential errors during file access or loading
         raise ConfigurationError(f"An unexpected error occurred while loading configuration from '{path_to_load}': {e}")
@@ -94,7 +143,7 @@ def get_config_value(key_path: str, default: any = None):
     value = config
     try:
         for key in keys:
-            if isinstance(value, dict):
+            if isinstance(value, Mapping):
                  value = value[key]
             else:
                  # If we encounter a non-dict structure while traversing, the path is invalid
@@ -105,7 +154,6 @@ def get_config_value(key_path: str, default: any = None):
         return default
     except Exception as e:
          # Handle unexpected errors during traversal
-         logger = get_logger() # Assuming logger is available or can be imported safely here
          logger.warning(f"Error accessing config key '{key_path}': {e}. Returning default.")
          return default
 
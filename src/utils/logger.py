@@ -4,16 +4,24 @@
 import logging
 import sys
 import os
+import threading
 from .config_loader import load_config # Use config loader to get logging settings
 
 # --- Singleton Metaclass ---
 class SingletonType(type):
-    """ Metaclass to ensure only one instance of the Logger exists. """
+    """ Metaclass to ensure only one instance of the Logger exists (thread-safe). """
     _instances = {}
+    _lock = threading.Lock()
     def __call__(cls, *args, **kwargs):
-        if cls not in cls._instances:
-            cls._instances[cls] = super(SingletonType, cls).__call__(*args, **kwargs)
-        return cls._instances[cls]
+        instance = cls._instances.get(cls) # Fast path: no lock once the instance exists
+        if instance is None:
+            with SingletonType._lock:
+                # Re-check under the lock so concurrent first calls build (and add handlers) only once
+                instance = cls._instances.get(cls)
+                if instance is None:
+                    instance = super(SingletonType, cls).__call__(*args, **kwargs)
+                    cls._instances[cls] = instance
+        return instance
 
 # --- Logger Class ---
 class Logger(metaclass=SingletonType):
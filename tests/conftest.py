@@ -0,0 +1,63 @@
+# tests/conftest.py
+# Shared test data and fixtures for the RelationshipScorer test modules.
+
+from types import MappingProxyType
+import pytest
+from src.main_scorer import RelationshipScorer
+from src.data_models.models import EntityMetadata
+
+# Canonical valid input, built once; tests that need a modified or plain-dict version work on a copy.deepcopy
+VALID_INPUT = {
+    "relationship_mentions": [
+        {"source_type": "Guideline", "year": 2023, "sentiment": "Positive"},
+        {"source_type": "Phase 3 CT", "year": 2022, "sentiment": "Positive"},
+        {"source_type": "PubMed", "year": 2020, "sentiment": "Neutral"},
+        {"source_type": "PubMed", "year": 2019, "sentiment": "Negative"} # Add more variety
+    ],
+    "entity_a_metadata": {
+        "id": "ENTITY_A_TEST",
+        "overall_prominence": 150.0
+    },
+    "entity_b_metadata": {
+        "id": "ENTITY_B_TEST",
+        "overall_prominence": 80.0
+    }
+}
+
+# The valid input's entity models, built once without validation (they are frozen, so safe to share)
+ENTITY_A = EntityMetadata.model_construct(**VALID_INPUT["entity_a_metadata"])
+ENTITY_B = EntityMetadata.model_construct(**VALID_INPUT["entity_b_metadata"])
+
+def _read_only(value):
+    """ Recursively wraps dicts in read-only MappingProxyType views and converts lists to tuples. """
+    if isinstance(value, dict):
+        return MappingProxyType({key: _read_only(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_read_only(item) for item in value)
+    return value
+
+# --- Fixtures ---
+
+@pytest.fixture(scope="module", autouse=True)
+def warm_scorer():
+    """ Imports the scoring modules and prepares the config once, so the first test does not pay for it. """
+    RelationshipScorer.warm_up()
+
+@pytest.fixture(scope="module")
+def valid_input_data():
+    """ Provides a read-only view of the valid input data, shared by each module's tests (accidental mutation raises). """
+    return _read_only(VALID_INPUT)
+
+@pytest.fixture(scope="module")
+def prebuilt_models(valid_input_data):
+    """ Provides the valid input's (mentions, entity A, entity B) models, built without validation. """
+    return (
+        [dict(mention) for mention in valid_input_data["relationship_mentions"]],
+        ENTITY_A,
+        ENTITY_B
+    )
+
+@pytest.fixture(scope="module")
+def scorer(prebuilt_models):
+    """ Provides one RelationshipScorer, shared by the tests that only read scores from it. """
+    return RelationshipScorer.from_models(*prebuilt_models)
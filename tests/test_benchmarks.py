@@ -0,0 +1,25 @@
+# tests/test_benchmarks.py
+# Performance regression benchmarks for RelationshipScorer (requires pytest-benchmark).
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from src.scoring import fused
+
+# Uses the shared, module-scoped `scorer` fixture from tests/conftest.py (warmed up by its autouse
+# warm_scorer fixture), so the benchmarks measure score calculation only, not setup or validation.
+
+# --- Benchmarks ---
+
+def test_bench_fused_calculate_all(benchmark, scorer):
+    """ Benchmark the fused pass behind get_all_scores (which caches its result per scorer) on the shared scorer's data. """
+    benchmark(
+        fused.calculate_all, None, scorer.entity_a.overall_prominence, scorer.entity_b.overall_prominence,
+        scorer.config, features=scorer.features
+    )
+
+def test_bench_get_all_scores_cached(benchmark, scorer):
+    """ Benchmark repeat get_all_scores calls, which assemble the scorer's cached scores. """
+    scorer.get_all_scores()
+    benchmark(scorer.get_all_scores)